@@ -4807,7 +4807,9 @@ def main() -> None:
 
     if report_mode == "monthly":
         try:
-            rollups_state = load_rollups_state(rollups_state_path)
+            # The state is saved right after the upsert below, so let that single write also carry any
+            # initialization or self-heal repairs instead of rewriting the file during load.
+            rollups_state = load_rollups_state(rollups_state_path, create_if_missing=False, persist_repairs=False)
             override = (os.getenv("ROLLUP_MONTH_OVERRIDE") or "").strip()
             month_key = determine_monthly_rollup_month(datetime.now(tz=STO), os.getenv("GITHUB_EVENT_NAME", ""), override)
             if override and month_key != override:
@@ -4850,6 +4852,7 @@ def main() -> None:
                 executive_summary=executive_summary,
                 top_items=rollup_items,
                 extra_fields=extra_fields,
+                now_iso=now_utc_iso,
             )
             prune_rollups(
                 rollups_state,
@@ -4857,7 +4860,7 @@ def main() -> None:
                 max_months=rollups_max_months,
                 keep_month=month_key,
             )
-            save_rollups_state(rollups_state_path, rollups_state)
+            save_rollups_state(rollups_state_path, rollups_state, now_iso=now_utc_iso)
         except Exception as e:
             print(f"[rollups] WARN: failed to persist monthly rollup: {e!r}")
 
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+from newsagent2.utils.json_compat import dump_state_bytes, parse_state_bytes
+
+
+def pretty_state_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        state = parse_state_bytes(f.read())
+    return dump_state_bytes(state)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Pretty-print a (possibly compact) state JSON file.")
+    parser.add_argument("path")
+    parser.add_argument("--in-place", action="store_true", default=False, help="Rewrite the file instead of printing it.")
+    args = parser.parse_args(argv)
+
+    payload = pretty_state_bytes(args.path)
+    if not args.in_place:
+        sys.stdout.buffer.write(payload)
+        return 0
+
+    # Per-process temp name, removed again on failure, as save_rollups_state does.
+    tmp_path = f"{args.path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, args.path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,17 +1,44 @@
 from __future__ import annotations
 
+import bisect
+import copy
 import json
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 import re
 from typing import Any, Dict, List, Sequence
 
 from .reporter import render_cyberlurch_yearly_analysis
+from .utils.json_compat import (
+    orjson_dump_state_bytes,
+    parse_state_bytes,
+    remember_state_file,
+    state_content_digest,
+    state_file_layout,
+    state_file_unchanged,
+)
 from zoneinfo import ZoneInfo
 
 STO = ZoneInfo("Europe/Stockholm")
 DEFAULT_ROLLUPS_PATH = "state/rollups.json"
 
+# abspath -> (raw file bytes, sanitized state or None) of the last clean file we loaded. Keyed on the
+# bytes rather than mtime/size so same-size rewrites within one timestamp tick can never be served
+# stale. Most runs load a path only once, so the first clean load keeps just the bytes and the state
+# copy is only taken when the same bytes are loaded again. One slot per path; callers get deep copies
+# so their mutations cannot leak into the cache.
+_LOAD_CACHE: Dict[str, tuple[bytes, Dict[str, Any] | None]] = {}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+# Emphasis markers plus every character str.strip() treats as whitespace (the last one is U+3000).
+_SUMMARY_TRIM_CHARS = "*_" + "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+# Necessary (not sufficient) condition for an "## Executive Summary"/"## Kurzüberblick" header line.
+_EXEC_HEADER_RE = re.compile(r"## \s*(?:executive summary|kurzüberblick)", re.IGNORECASE)
+_EXEC_HEADER_PREFIXES = ("executive summary", "kurzüberblick")
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
@@ -36,10 +63,9 @@ def _parse_generated_at(value: str) -> datetime:
 
 def _sanitize_rollups_state(state: Dict[str, Any]) -> bool:
     changed = False
-    reports = state.setdefault("reports", {})
+    reports = state.get("reports")
     if not isinstance(reports, dict):
-        state["reports"] = {}
-        reports = state["reports"]
+        reports = state["reports"] = {}
         changed = True
 
     for report_key, entries in list(reports.items()):
@@ -61,8 +87,8 @@ def _sanitize_rollups_state(state: Dict[str, Any]) -> bool:
 
             top_items_raw = entry.get("top_items")
             if isinstance(top_items_raw, list):
-                sanitized_items = [_sanitize_item(it) for it in top_items_raw if isinstance(it, dict)]
-                if sanitized_items != top_items_raw:
+                sanitized_items, items_changed = _sanitize_top_items(top_items_raw)
+                if items_changed:
                     entry["top_items"] = sanitized_items
                     changed = True
             else:
@@ -70,8 +96,7 @@ def _sanitize_rollups_state(state: Dict[str, Any]) -> bool:
                 entry["top_items"] = sanitized_items
                 changed = True
 
-            fallback = _fallback_summary_from_items(sanitized_items)
-            sanitized_summary = sanitize_rollup_summary(entry.get("executive_summary") or [], fallback=fallback)
+            sanitized_summary = _summary_with_item_fallback(entry.get("executive_summary") or [], sanitized_items)
             limited_summary = sanitized_summary[:8]
             if limited_summary != entry.get("executive_summary"):
                 entry["executive_summary"] = limited_summary
@@ -98,7 +123,17 @@ def _sanitize_rollups_state(state: Dict[str, Any]) -> bool:
     return changed
 
 
-def load_rollups_state(path: str, *, create_if_missing: bool = True) -> Dict[str, Any]:
+# JSON is the only on-disk format: state/ is committed and diffed by the workflow and the maintenance
+# tools read the file directly, so a binary sidecar would just be a second copy to keep in sync.
+# Repeat loads within one process are served by _LOAD_CACHE instead.
+def load_rollups_state(
+    path: str,
+    *,
+    create_if_missing: bool = True,
+    persist_repairs: bool = True,
+) -> Dict[str, Any]:
+    # Callers that save the state themselves shortly afterwards can pass create_if_missing=False and
+    # persist_repairs=False so the fresh/self-healed state is written once, together with their update.
     if not path:
         print("[rollups] WARN: empty path -> starting fresh")
         return _new_state()
@@ -113,10 +148,18 @@ def load_rollups_state(path: str, *, create_if_missing: bool = True) -> Dict[str
                 print(f"[rollups] WARN: failed to initialize rollups state at {path!r}: {e!r}")
         return state
 
+    cache_key = os.path.abspath(path)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = f.read().strip()
-        if not raw:
+        # Both parsers accept UTF-8 bytes directly, so skip the separate decode + strip copies.
+        with open(path, "rb") as f:
+            raw = f.read()
+            st = os.fstat(f.fileno())
+        cached = _LOAD_CACHE.get(cache_key)
+        seen_before = cached is not None and cached[0] == raw
+        if seen_before and cached[1] is not None:
+            # Unchanged since the last clean load: skip parsing and the sanitize pass.
+            return copy.deepcopy(cached[1])
+        if not raw or raw.isspace():
             print(f"[rollups] WARN: state file {path!r} is empty -> starting fresh")
             state = _new_state()
             if create_if_missing:
@@ -126,11 +169,12 @@ def load_rollups_state(path: str, *, create_if_missing: bool = True) -> Dict[str
                     print(f"[rollups] WARN: failed to reinitialize empty rollups state at {path!r}: {e!r}")
             return state
 
-        data = json.loads(raw)
+        data = parse_state_bytes(raw)
         if not isinstance(data, dict):
             print(f"[rollups] WARN: invalid JSON root type in {path!r} -> starting fresh")
             return _new_state()
 
+        complete = "version" in data and "updated_at_utc" in data
         data.setdefault("version", 1)
         data.setdefault("updated_at_utc", _utc_now_iso())
         data.setdefault("reports", {})
@@ -138,11 +182,15 @@ def load_rollups_state(path: str, *, create_if_missing: bool = True) -> Dict[str
             data["reports"] = {}
 
         changed = _sanitize_rollups_state(data)
-        if changed and path:
+        if changed and path and persist_repairs:
             try:
                 save_rollups_state(path, data)
             except Exception as e:
                 print(f"[rollups] WARN: failed to self-heal state at {path!r}: {e!r}")
+        elif not changed and complete:
+            # The file already holds exactly this content, so an unchanged save can be skipped.
+            remember_state_file(path, state_content_digest(data), state_file_layout(raw), st)
+            _LOAD_CACHE[cache_key] = (raw, copy.deepcopy(data) if seen_before else None)
 
         return data
     except Exception as e:
@@ -162,7 +210,21 @@ def load_rollups_state(path: str, *, create_if_missing: bool = True) -> Dict[str
         return _new_state()
 
 
-def save_rollups_state(path: str, state: Dict[str, Any]) -> None:
+def _fsync_directory(dir_path: str) -> None:
+    # Persist the rename itself; best effort because not every platform can open directories.
+    try:
+        dir_fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def save_rollups_state(path: str, state: Dict[str, Any], *, now_iso: str | None = None) -> None:
     if not path:
         print("[rollups] WARN: empty path -> not saving")
         return
@@ -176,58 +238,102 @@ def save_rollups_state(path: str, state: Dict[str, Any]) -> None:
         print(f"[rollups] ERROR: cannot create state directory for {path!r}: {e!r}")
         raise
 
-    state["updated_at_utc"] = _utc_now_iso()
-    payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True)
-    tmp_path = f"{path}.tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        f.write(payload)
-        f.write("\n")
-    os.replace(tmp_path, path)
+    _LOAD_CACHE.pop(os.path.abspath(path), None)
+    digest = state_content_digest(state)
+    # Rollups are always written in the pretty (compact=False) layout.
+    if state_file_unchanged(path, digest, False):
+        print(f"[rollups] State unchanged since last save -> skipping write to {path!r}")
+        return
+
+    state["updated_at_utc"] = now_iso or _utc_now_iso()
+    # None means "use the stdlib encoder", which is streamed straight into the file below.
+    payload = orjson_dump_state_bytes(state)
+    durable = (os.getenv("ROLLUPS_STATE_FSYNC", "1") or "1").strip() != "0"
+    # Per-process temp name so concurrent writers never share (and truncate) one scratch file; the
+    # rename stays the single atomic publish step and a failed write leaves no stray temp behind.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        if payload is not None:
+            f = open(tmp_path, "wb")
+        else:
+            f = open(tmp_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20)
+        with f:
+            if payload is not None:
+                f.write(payload)
+            else:
+                # Encode chunk by chunk so the whole document is never held in memory as one string.
+                json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+                f.write("\n")
+            if durable:
+                # Flush the data before the rename so a crash cannot publish an empty/truncated file.
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_directory(os.path.dirname(path) or ".")
+    remember_state_file(path, digest, False)
     print(f"[rollups] Saved rollups to {path!r}")
 
 
 def _sanitize_item(it: Dict[str, Any]) -> Dict[str, Any]:
-    title = (it.get("title") or "").strip()
-    url = (it.get("url") or "").strip()
-    channel = (it.get("channel") or "").strip()
-    source = (it.get("source") or "").strip()
-    top_pick = bool(it.get("top_pick"))
-    bottom_line_raw = (it.get("bottom_line") or "").strip()
-    bottom_line_cleaned = re.sub(r"\s+", " ", bottom_line_raw)
-    bottom_line = bottom_line_cleaned[:600].strip()
-    published = it.get("published_at") or it.get("date") or ""
+    get = it.get
+    published = get("published_at") or get("date") or ""
     date_val = ""
     if isinstance(published, datetime):
-        date_val = published.astimezone(timezone.utc).strftime("%Y-%m-%d")
+        date_val = published.astimezone(timezone.utc).date().isoformat()
     else:
         date_val = str(published).strip()
-        if date_val:
+        # A bare YYYY-MM-DD (the stored "date" shape) comes back unchanged, so skip the datetime round-trip.
+        if date_val and not _ISO_DATE_RE.fullmatch(date_val):
             try:
-                dt = datetime.fromisoformat(date_val.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                date_val = dt.strftime("%Y-%m-%d")
+                # Only the calendar date of the stated offset is kept, so the tzinfo is irrelevant here.
+                date_val = datetime.fromisoformat(date_val.replace("Z", "+00:00")).date().isoformat()
             except Exception:
                 pass
 
     return {
-        "title": title,
-        "url": url,
-        "channel": channel,
-        "source": source,
-        "top_pick": top_pick,
+        "title": (get("title") or "").strip(),
+        "url": (get("url") or "").strip(),
+        "channel": (get("channel") or "").strip(),
+        "source": (get("source") or "").strip(),
+        "top_pick": bool(get("top_pick")),
         "date": date_val,
-        "bottom_line": bottom_line,
-        "topic_primary": (it.get("topic_primary") or "").strip(),
-        "topics": it.get("topics") or [],
-        "text_source": (it.get("text_source") or "").strip(),
-        "content_status": (it.get("content_status") or "").strip(),
-        "transcript_processing": (it.get("transcript_processing") or "").strip(),
-        "editorial_relevance": (it.get("editorial_relevance") or "").strip(),
-        "transcript_full_summary_short": re.sub(r"\s+", " ", str(it.get("transcript_full_summary_short") or "").strip())[:600],
+        "bottom_line": _WHITESPACE_RE.sub(" ", (get("bottom_line") or "").strip())[:600].strip(),
+        "topic_primary": (get("topic_primary") or "").strip(),
+        "topics": get("topics") or [],
+        "text_source": (get("text_source") or "").strip(),
+        "content_status": (get("content_status") or "").strip(),
+        "transcript_processing": (get("transcript_processing") or "").strip(),
+        "editorial_relevance": (get("editorial_relevance") or "").strip(),
+        "transcript_full_summary_short": _WHITESPACE_RE.sub(" ", str(get("transcript_full_summary_short") or "").strip())[:600],
     }
 
 
+def _sanitize_top_items(raw_items: List[Any]) -> tuple[List[Dict[str, Any]], bool]:
+    # Tracks whether sanitizing changed anything while building the list, instead of deep-comparing
+    # the whole result afterwards. Already-clean items are kept as-is, and once a change is seen the
+    # remaining items are no longer compared.
+    sanitized: List[Dict[str, Any]] = []
+    changed = False
+    for it in raw_items:
+        if not isinstance(it, dict):
+            changed = True
+            continue
+        clean = _sanitize_item(it)
+        if changed or clean != it:
+            changed = True
+            sanitized.append(clean)
+        else:
+            sanitized.append(it)
+    return sanitized, changed
+
+
 def _month_sort_key(month_str: str) -> tuple[int, str]:
     raw = (month_str or "").strip()
     try:
@@ -237,6 +343,12 @@ def _month_sort_key(month_str: str) -> tuple[int, str]:
         return (1, raw)
 
 
+def _rollup_sort_key(entry: Any) -> tuple[int, str]:
+    if not isinstance(entry, dict):
+        return (1, "")
+    return _month_sort_key(str(entry.get("month") or ""))
+
+
 def upsert_monthly_rollup(
     state: Dict[str, Any],
     *,
@@ -246,6 +358,7 @@ def upsert_monthly_rollup(
     executive_summary: Sequence[str],
     top_items: Sequence[Dict[str, Any]],
     extra_fields: Dict[str, Any] | None = None,
+    now_iso: str | None = None,
 ) -> Dict[str, Any]:
     if not isinstance(state, dict):
         raise TypeError(f"upsert_monthly_rollup expects dict state, got {type(state)!r}")
@@ -255,23 +368,17 @@ def upsert_monthly_rollup(
     if not month_key:
         raise ValueError("month is required for monthly rollup")
 
-    reports = state.setdefault("reports", {})
+    reports = state.get("reports")
     if not isinstance(reports, dict):
-        state["reports"] = {}
-        reports = state["reports"]
+        reports = state["reports"] = {}
 
-    rollups = reports.setdefault(rk, [])
+    rollups = reports.get(rk)
     if not isinstance(rollups, list):
-        reports[rk] = []
-        rollups = reports[rk]
+        rollups = reports[rk] = []
 
-    sanitized_items = [_sanitize_item(it) for it in top_items if it]
-    sanitized_exec = sanitize_rollup_summary(
-        executive_summary,
-        fallback=_fallback_summary_from_items(sanitized_items),
-    )
-    if not sanitized_exec:
-        sanitized_exec = _fallback_summary_from_items(sanitized_items)
+    sanitize_item = _sanitize_item
+    sanitized_items = [sanitize_item(it) for it in top_items if it]
+    sanitized_exec = _summary_with_item_fallback(executive_summary, sanitized_items)
 
     payload = {
         "month": month_key,
@@ -282,17 +389,26 @@ def upsert_monthly_rollup(
     if isinstance(extra_fields, dict):
         payload.update(extra_fields)
 
-    replaced = False
-    for idx, entry in enumerate(rollups):
+    # Valid YYYY-MM months lead the list in month order (load, prune and upsert all preserve it), so
+    # they are found by bisection: a replacement stays in place and a new month is inserted at its
+    # position. The tail after them mixes invalid months with passthrough entries and is not sorted
+    # by _rollup_sort_key, so any other month is matched by a linear scan and appended when new.
+    target = _month_sort_key(month_key)
+    if target[0] == 0:
+        lo = bisect.bisect_left(rollups, target, key=_rollup_sort_key)
+        hi = bisect.bisect_right(rollups, target, lo=lo, key=_rollup_sort_key)
+    else:
+        lo, hi = 0, len(rollups)
+    for idx in range(lo, hi):
+        entry = rollups[idx]
         if isinstance(entry, dict) and entry.get("month") == month_key:
             rollups[idx] = payload
-            replaced = True
             break
-    if not replaced:
-        rollups.append(payload)
+    else:
+        rollups.insert(hi, payload)
 
-    rollups.sort(key=lambda e: _month_sort_key(str(e.get("month") or "")))
-    state["updated_at_utc"] = _utc_now_iso()
+    # Batch callers pass one run timestamp in so a loop of upserts + save does not re-read the clock.
+    state["updated_at_utc"] = now_iso or _utc_now_iso()
     return state
 
 
@@ -310,10 +426,9 @@ def prune_rollups(
         return state
 
     rk = (report_key or "").strip() or "default"
-    reports = state.setdefault("reports", {})
+    reports = state.get("reports")
     if not isinstance(reports, dict):
-        state["reports"] = {}
-        reports = state["reports"]
+        reports = state["reports"] = {}
 
     rollups = reports.get(rk, [])
     if not isinstance(rollups, list):
@@ -363,7 +478,13 @@ def extract_summary_bullets(markdown_text: str, max_bullets: int = 8, *, require
     if not text:
         return []
 
-    lines = [ln.rstrip() for ln in text.splitlines()]
+    if require_exec_section:
+        # Nothing before the first executive-summary header can contribute, so skip straight to its line.
+        header_match = _EXEC_HEADER_RE.search(text)
+        if header_match is None:
+            return []
+        text = text[text.rfind("\n", 0, header_match.start()) + 1 :]
+
     bullets: List[str] = []
     exec_section_found = False
 
@@ -377,28 +498,31 @@ def extract_summary_bullets(markdown_text: str, max_bullets: int = 8, *, require
 
     in_exec_section = False
     sentence_pool: List[str] = []
+    # Length of " ".join(sentence_pool) + 1, kept incrementally instead of re-joining on every line.
+    pool_len = 0
 
-    for ln in lines:
+    for ln in text.splitlines():
         stripped = ln.strip()
         if not stripped:
             continue
-        if stripped.lower().startswith("## "):
+        if stripped.startswith("## "):
             header = stripped[3:].strip().lower()
-            is_exec_header = header.startswith("executive summary") or header.startswith("kurzüberblick")
-            if is_exec_header:
+            if header.startswith(_EXEC_HEADER_PREFIXES):
                 exec_section_found = True
                 in_exec_section = True
                 bullets = []
                 sentence_pool = []
+                pool_len = 0
             else:
                 if in_exec_section:
                     _flush_sentence_pool(sentence_pool)
                     break
                 _flush_sentence_pool(sentence_pool)
                 sentence_pool = []
+                pool_len = 0
                 in_exec_section = False
             continue
-        if stripped.lower().startswith("### "):
+        if stripped.startswith("### "):
             if in_exec_section:
                 _flush_sentence_pool(sentence_pool)
                 break
@@ -412,9 +536,11 @@ def extract_summary_bullets(markdown_text: str, max_bullets: int = 8, *, require
                         break
                 continue
             sentence_pool.append(stripped)
-            if len(" ".join(sentence_pool)) > 240 or stripped.endswith("."):
+            pool_len += len(stripped) + 1
+            if pool_len > 241 or stripped.endswith("."):
                 _flush_sentence_pool(sentence_pool)
                 sentence_pool = []
+                pool_len = 0
                 if len(bullets) >= max_bullets:
                     break
 
@@ -424,78 +550,85 @@ def extract_summary_bullets(markdown_text: str, max_bullets: int = 8, *, require
     return bullets[:max_bullets]
 
 
-def sanitize_rollup_summary(lines: Sequence[str] | str, *, fallback: Sequence[str] | None = None) -> List[str]:
-    forbidden = [
-        "metadata",
-        "run metadata",
-        "attached",
-        "lookback window",
-        "foamed source health",
-        "pubmed items",
-        "foamed items",
-    ]
+_FORBIDDEN_SUMMARY_TERMS = (
+    "metadata",
+    "run metadata",
+    "attached",
+    "lookback window",
+    "foamed source health",
+    "pubmed items",
+    "foamed items",
+)
+_FORBIDDEN_SUMMARY_RE = re.compile("|".join(re.escape(term) for term in _FORBIDDEN_SUMMARY_TERMS))
 
-    def _clean(raw_lines: Sequence[str] | str) -> List[str]:
-        cleaned: List[str] = []
-        if isinstance(raw_lines, str):
-            iterable: Sequence[str] = [raw_lines]
-        else:
-            iterable = raw_lines or []
 
-        for raw in iterable:
-            text = str(raw or "").strip()
-            if not text:
-                continue
-            if text.startswith(("- ", "* ")):
-                text = text[2:].lstrip()
-            while text.startswith(("*", "_")):
-                text = text[1:].lstrip()
-            while text.endswith(("*", "_")):
-                text = text[:-1].rstrip()
-            text = text.replace("**", "").strip()
-            lowered = text.lower()
-            if any(term in lowered for term in forbidden) or re.search(r"\bmetadata\b", lowered):
-                continue
-            if text:
-                cleaned.append(text)
-        return cleaned
+def _clean_summary_lines(raw_lines: Sequence[str] | str) -> List[str]:
+    cleaned: List[str] = []
+    if isinstance(raw_lines, str):
+        iterable: Sequence[str] = [raw_lines]
+    else:
+        iterable = raw_lines or []
+
+    for raw in iterable:
+        text = str(raw or "").strip()
+        if not text:
+            continue
+        if text.startswith(("- ", "* ")):
+            text = text[2:]
+        text = text.strip(_SUMMARY_TRIM_CHARS).replace("**", "").strip()
+        if _FORBIDDEN_SUMMARY_RE.search(text.lower()):
+            continue
+        if text:
+            cleaned.append(text)
+    return cleaned
 
-    cleaned_primary = _clean(lines)
+
+def sanitize_rollup_summary(lines: Sequence[str] | str, *, fallback: Sequence[str] | None = None) -> List[str]:
+    cleaned_primary = _clean_summary_lines(lines)
     if cleaned_primary:
         return cleaned_primary
 
     fb_lines: Sequence[str] = fallback if fallback is not None else ["Highlights derived from top items."]
-    cleaned_fallback = _clean(fb_lines)
+    cleaned_fallback = _clean_summary_lines(fb_lines)
     return cleaned_fallback or ["Highlights derived from top items."]
 
 
 def _fallback_summary_from_items(top_items: Sequence[Dict[str, Any]]) -> List[str]:
-    ranked: List[Dict[str, Any]] = []
-    for idx, item in enumerate(top_items or []):
-        bottom_line = (item.get("bottom_line") or "").strip()
-        snippet = re.sub(r"\s+", " ", bottom_line)[:120].strip()
-        ranked.append(
-            {
-                "title": (item.get("title") or "").strip(),
-                "top_pick": bool(item.get("top_pick")),
-                "bottom_line": snippet,
-                "_idx": idx,
-            }
-        )
-    ranked.sort(key=lambda it: (0 if it.get("top_pick") else 1, it.get("_idx", 0)))
-    entries = [it for it in ranked if it.get("title")]
-    if not entries:
+    # Top picks first, otherwise original order; only two titled items are ever shown,
+    # so stop as soon as two top picks are found.
+    starred: List[tuple[str, Dict[str, Any]]] = []
+    rest: List[tuple[str, Dict[str, Any]]] = []
+    for item in top_items or []:
+        title = (item.get("title") or "").strip()
+        if not title:
+            continue
+        if item.get("top_pick"):
+            starred.append((title, item))
+            if len(starred) >= 2:
+                break
+        elif len(rest) < 2:
+            rest.append((title, item))
+
+    chosen = (starred + rest)[:2]
+    if not chosen:
         return ["(no summary captured)"]
     bullets = ["Highlights derived from top items."]
-    for it in entries[:2]:
-        prefix = "⭐ " if it.get("top_pick") else ""
-        line = f"{prefix}{it['title']}"
-        if it.get("bottom_line"):
-            line = f"{line} — {it['bottom_line']}"
+    for title, item in chosen:
+        prefix = "⭐ " if item.get("top_pick") else ""
+        line = f"{prefix}{title}"
+        snippet = _WHITESPACE_RE.sub(" ", (item.get("bottom_line") or "").strip())[:120].strip()
+        if snippet:
+            line = f"{line} — {snippet}"
         bullets.append(line)
     return bullets
 
 
+def _summary_with_item_fallback(lines: Sequence[str] | str, top_items: Sequence[Dict[str, Any]]) -> List[str]:
+    # Same result as sanitize_rollup_summary(lines, fallback=_fallback_summary_from_items(top_items)),
+    # but the item-derived fallback is only built when the summary itself cleans down to nothing.
+    return _clean_summary_lines(lines) or sanitize_rollup_summary((), fallback=_fallback_summary_from_items(top_items))
+
+
 def derive_monthly_summary(
     overview_markdown: str,
     *,
@@ -504,15 +637,14 @@ def derive_monthly_summary(
 ) -> List[str]:
     cleaned_overview = _strip_metadata_sections(overview_markdown)
     exec_bullets = extract_summary_bullets(cleaned_overview, max_bullets=max_bullets, require_exec_section=True)
-    fallback = _fallback_summary_from_items(top_items)
-    sanitized_exec = sanitize_rollup_summary(exec_bullets, fallback=fallback)
+    sanitized_exec = _summary_with_item_fallback(exec_bullets, top_items)
     sanitized_exec = sanitized_exec[:max_bullets]
     return sanitized_exec or ["(no summary captured)"]
 
 
 def normalize_rollup_summary(entry: Dict[str, Any]) -> List[str]:
     raw_summary = entry.get("executive_summary") or []
-    summary = sanitize_rollup_summary(raw_summary, fallback=_fallback_summary_from_items(entry.get("top_items") or []))
+    summary = _summary_with_item_fallback(raw_summary, entry.get("top_items") or [])
     return summary or ["(no summary captured)"]
 
 
@@ -568,7 +700,10 @@ def rollups_for_year(state: Dict[str, Any], report_key: str, year: int) -> List[
 
     prefix = f"{year:04d}-"
     filtered = [r for r in rollups if isinstance(r, dict) and str(r.get("month") or "").startswith(prefix)]
-    return sorted(filtered, key=lambda r: r.get("month") or "")
+    # Every kept month shares the "YYYY-" prefix, so plain string order is month order. Stored lists are
+    # already month-sorted but malformed months sit in the tail, so a bisected slice could miss them.
+    filtered.sort(key=itemgetter("month"))
+    return filtered
 
 
 def _short_bottom_line(text: str, *, max_len: int = 160) -> str:
@@ -601,6 +736,71 @@ def _derive_themes(items: Sequence[Dict[str, Any]]) -> List[str]:
     return themes[:4]
 
 
+@lru_cache(maxsize=512)
+def _month_label(month_value: str) -> str:
+    # "January 2025" for a YYYY-MM month, "" otherwise; strptime is slow and months repeat across renders.
+    try:
+        return datetime.strptime(f"{month_value}-01", "%Y-%m-%d").strftime("%B %Y")
+    except Exception:
+        return ""
+
+
+def _format_month_item(item: Dict[str, Any]) -> str:
+    # ``item`` comes from _sanitize_item, so its string fields are already stripped.
+    title = item["title"] or "(untitled)"
+    url = item["url"]
+    channel = item["channel"]
+    date = item["date"]
+    snippet = _short_bottom_line(item["bottom_line"], max_len=140)
+    line = f"{title}" if not url else f"[{title}]({url})"
+    if channel:
+        line = f"{line} — {channel}"
+    if date:
+        line = f"{line} — {date}"
+    if snippet:
+        line = f"{line} — {snippet}"
+    return line
+
+
+def _collect_top_items(month_entries: Sequence[Dict[str, Any]], *, limit: int | None = None) -> List[Dict[str, Any]]:
+    # Top picks first, then the rest, both in month order. With a limit, stop scanning once enough
+    # top picks are found and only sanitize the items that actually make the cut.
+    starred: List[tuple[str, Dict[str, Any]]] = []
+    other: List[tuple[str, Dict[str, Any]]] = []
+    for entry in month_entries:
+        label = entry["label"]
+        for raw_item in entry["items"]:
+            if raw_item.get("top_pick"):
+                starred.append((label, raw_item))
+            elif limit is None or len(other) < limit:
+                other.append((label, raw_item))
+        if limit is not None and len(starred) >= limit:
+            break
+
+    chosen = starred + other
+    if limit is not None:
+        chosen = chosen[:limit]
+
+    collected: List[Dict[str, Any]] = []
+    for label, raw_item in chosen:
+        item = _sanitize_item(raw_item)
+        item["month_label"] = label
+        collected.append(item)
+    return collected
+
+
+def _join_markdown_lines(md: List[str]) -> str:
+    # Trim trailing blank lines on the list itself so the joined document is not copied twice more
+    # by rstrip() and the "+ \n" concatenation.
+    while md and not md[-1].strip():
+        md.pop()
+    if not md:
+        return "\n"
+    md[-1] = md[-1].rstrip()
+    md.append("")
+    return "\n".join(md)
+
+
 def render_yearly_markdown(
     *,
     report_title: str,
@@ -618,38 +818,22 @@ def render_yearly_markdown(
         return render_cyberlurch_yearly_analysis(rollups, target_year=year, generated_at=datetime.now(tz=STO))
     now_str = datetime.now(tz=STO).strftime("%Y-%m-%d %H:%M") + (" Uhr" if is_de else "")
 
-    def _month_label(month_value: str) -> str:
-        try:
-            return datetime.strptime(f"{month_value}-01", "%Y-%m-%d").strftime("%B %Y")
-        except Exception:
-            return month_value or str(year)
-
     sorted_rollups = sorted(
         [entry for entry in rollups if isinstance(entry, dict)],
         key=lambda entry: _month_sort_key(str(entry.get("month") or "")),
     )
     rollup_count = len(sorted_rollups)
     normalized_rollups: List[Dict[str, Any]] = []
-    starred_items: List[Dict[str, Any]] = []
-    other_items: List[Dict[str, Any]] = []
 
+    # One pass over the months: label and dict-only item list are reused by every section below.
     for entry in sorted_rollups:
         month = str(entry.get("month") or "")
-        label = _month_label(month)
-        summary = normalize_rollup_summary(entry)
-        items: List[Dict[str, Any]] = []
-        for raw_item in entry.get("top_items") or []:
-            if not isinstance(raw_item, dict):
-                continue
-            normalized_item = _sanitize_item(raw_item)
-            normalized_item["month_label"] = label
-            items.append(normalized_item)
-            (starred_items if normalized_item.get("top_pick") else other_items).append(normalized_item)
-        normalized_rollups.append({"month": month, "label": label, "summary": summary, "items": items})
-
-    combined_items = starred_items + other_items
-    top_ten = combined_items[:10]
+        label = _month_label(month) or month or str(year)
+        items = [raw_item for raw_item in (entry.get("top_items") or []) if isinstance(raw_item, dict)]
+        normalized_rollups.append({"label": label, "entry": entry, "items": items})
+
     if is_cybermed:
+        combined_items = _collect_top_items(normalized_rollups)
         digests = [d for d in (daily_digests or []) if isinstance(d, dict)]
         digest_items: List[Dict[str, Any]] = []
         for d in digests:
@@ -679,30 +863,28 @@ def render_yearly_markdown(
             "",
             "## Executive summary",
         ])
-        for it in ranked[:8]:
-            md.append(f"- {(it.get('bottom_line') or it.get('title') or 'Stored item').strip()}")
+        md.extend(f"- {(it.get('bottom_line') or it.get('title') or 'Stored item').strip()}" for it in ranked[:8])
         md.extend(["", "## Top papers of the year"])
         for it in ranked[:10]:
             t = it.get("title") or "Untitled"
             u = it.get("url") or ""
             bl = (it.get("bottom_line") or "No stored bottom line.").strip()
-            md.append(f"- [{t}]({u})" if u else f"- {t}")
-            md.append(f"  - **BOTTOM LINE:** {bl}")
+            md.extend((f"- [{t}]({u})" if u else f"- {t}", f"  - **BOTTOM LINE:** {bl}"))
         md.extend(["", "## Potentially practice-changing items"])
-        for it in practice_changing:
-            md.append(f"- {(it.get('title') or 'Untitled').strip()} — impact {it.get('practice_change_potential_1_5')}")
+        md.extend(
+            f"- {(it.get('title') or 'Untitled').strip()} — impact {it.get('practice_change_potential_1_5')}"
+            for it in practice_changing
+        )
         md.extend(["", "## Interesting but not practice-changing"])
-        for it in interesting[:8]:
-            md.append(f"- {(it.get('title') or 'Untitled').strip()}")
+        md.extend(f"- {(it.get('title') or 'Untitled').strip()}" for it in interesting[:8])
         if guidelines:
             md.extend(["", "## Guidelines / consensus / systematic reviews"])
-            for it in guidelines:
-                md.append(f"- {(it.get('title') or 'Untitled').strip()}")
+            md.extend(f"- {(it.get('title') or 'Untitled').strip()}" for it in guidelines)
         md.extend(["", "## Clinical themes of the year", "- Critical care & emergency medicine", "- Anaesthesia & perioperative care", "- Sepsis/infection", "- Ventilation/respiratory", "- AI/methods", "", "## FOAMed & commentary", "- Included for interpretation/context; not treated as primary evidence.", "", "## What to watch next year"])
-        for it in ranked[:5]:
-            md.append(f"- Recurring signal: {(it.get('topic_primary') or it.get('title') or 'General').strip()}")
-        return "\n".join(md).strip() + "\n"
+        md.extend(f"- Recurring signal: {(it.get('topic_primary') or it.get('title') or 'General').strip()}" for it in ranked[:5])
+        return _join_markdown_lines(md)
 
+    top_ten = _collect_top_items(normalized_rollups, limit=10)
     md: List[str] = [
         f"<h1 style=\"margin:0 0 4px 0; font-size:32px; line-height:1.15;\">{report_title}</h1>",
         f"*{now_str}*",
@@ -710,8 +892,7 @@ def render_yearly_markdown(
     ]
 
     if rollup_count < 6:
-        md.append(f"Coverage note: only {rollup_count} monthly editions were available for this year.")
-        md.append("")
+        md.extend((f"Coverage note: only {rollup_count} monthly editions were available for this year.", ""))
 
     md.append("## Executive Summary" if not is_de else "## Kurzüberblick")
     if not normalized_rollups:
@@ -737,72 +918,51 @@ def render_yearly_markdown(
                 url = item.get("url") or ""
                 snippet = _short_bottom_line(item.get("bottom_line") or "", max_len=180)
                 link = f"[{title}]({url})" if url else title
-                line = f"  - {link}"
-                if snippet:
-                    line = f"{line} — {snippet}"
-                md.append(line)
+                md.append(f"  - {link} — {snippet}" if snippet else f"  - {link}")
         else:
             md.append("  - (no monthly highlights captured)")
-    md.append("")
-
-    md.append("## Top 10 items" if not is_de else "## Top 10 Artikel")
-    md.append("")
+    md.extend(("", "## Top 10 items" if not is_de else "## Top 10 Artikel", ""))
 
     if not top_ten:
         md.append("- No monthly highlights were captured.")
     else:
+        md_append = md.append
         for item in top_ten:
             prefix = "⭐ " if item["top_pick"] else ""
             title = item["title"]
             url = item["url"]
-            meta_parts = [p for p in (item.get("channel"), item.get("date"), item.get("month_label")) if p]
-            meta = f" — {' · '.join(meta_parts)}" if meta_parts else ""
+            meta = " · ".join(filter(None, (item["channel"], item["date"], item["month_label"])))
+            if meta:
+                meta = f" — {meta}"
             line = f"- {prefix}[{title}]({url}){meta}" if url else f"- {prefix}{title}{meta}"
             if not url:
                 line = line.replace("[]()", "")  # guard against empty markdown links if url missing
-            md.append(line)
+            md_append(line)
             bottom_line_text = _short_bottom_line(item.get("bottom_line") or "", max_len=220)
             if bottom_line_text:
-                md.append(f"  - **BOTTOM LINE:** {bottom_line_text}")
+                md_append(f"  - **BOTTOM LINE:** {bottom_line_text}")
             else:
                 fallback_topic = str(item.get("topic_primary") or "").strip() or "General Cyberlurch items"
                 fallback_parts = [p for p in [item.get("title"), item.get("channel"), fallback_topic] if str(p or "").strip()]
-                md.append(f"  - **BOTTOM LINE:** {' — '.join(str(p).strip() for p in fallback_parts)}")
-    md.append("")
-
-    md.append("## By month" if not is_de else "## Nach Monaten")
+                md_append(f"  - **BOTTOM LINE:** {' — '.join(str(p).strip() for p in fallback_parts)}")
+    md.extend(("", "## By month" if not is_de else "## Nach Monaten"))
     for entry in normalized_rollups:
-        heading = entry["label"]
-        md.append(f"### {heading}")
-        md.append("")
+        md.extend((f"### {entry['label']}", ""))
 
         bullets: List[str] = []
-        summary = entry["summary"]
+        # Only the month overview needs the sanitized summary; the Cybermed branch never reads it.
+        summary = normalize_rollup_summary(entry["entry"])
         if summary:
             bullets.append(summary[0])
 
         items = entry["items"]
         primary_item = None
-        if items:
-            primary_item = next((it for it in items if it.get("top_pick")), items[0])
         secondary_item = None
-        if items and len(items) > 1:
-            secondary_candidates = [it for it in items if it is not primary_item]
-            if secondary_candidates:
-                secondary_item = secondary_candidates[0]
-
-        def _format_month_item(item: Dict[str, Any]) -> str:
-            title = item.get("title") or "(untitled)"
-            url = item.get("url") or ""
-            label_parts = [p for p in ((item.get("channel") or "").strip(), (item.get("date") or "").strip()) if p]
-            label = " — ".join(label_parts) if label_parts else ""
-            snippet = _short_bottom_line(item.get("bottom_line") or "", max_len=140)
-            line = f"{title}" if not url else f"[{title}]({url})"
-            if label:
-                line = f"{line} — {label}"
-            if snippet:
-                line = f"{line} — {snippet}"
-            return line
+        if items:
+            primary_idx = next((idx for idx, it in enumerate(items) if it.get("top_pick")), 0)
+            primary_item = _sanitize_item(items[primary_idx])
+            if len(items) > 1:
+                secondary_item = _sanitize_item(items[1 if primary_idx == 0 else 0])
 
         if primary_item and len(bullets) < 3:
             bullets.append(_format_month_item(primary_item))
@@ -812,7 +972,7 @@ def render_yearly_markdown(
         if not bullets:
             bullets.append("(no summary captured)")
 
-        md.extend([f"- {b}" for b in bullets])
+        md.extend(f"- {b}" for b in bullets)
         md.append("")
 
-    return "\n".join(md).rstrip() + "\n"
+    return _join_markdown_lines(md)
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import re
 from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Tuple, Set
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, List, Tuple, Set
+
+try:  # optional: one-pass multi-keyword matching for long keyword lists
+    import ahocorasick
+except Exception:  # pragma: no cover - substring-scan fallback
+    ahocorasick = None
+
+# Below this many keywords, separate `in` scans beat one automaton pass over a ~2KB haystack.
+_AUTOMATON_MIN_KEYWORDS = 16
+# heapq.nsmallest only beats a full sort once the pool is roughly 10x the number of items kept.
+_HEAP_SELECT_MIN_RATIO = 10
 
 
 @dataclass(frozen=True)
@@ -38,6 +50,10 @@ class FoamedSelection:
     stats: Dict[str, Any]
 
 
+# Parsed configs keyed by path and validated against (mtime_ns, size); callers treat the dict as read-only.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def load_cybermed_selection_config(path: str = "data/cybermed_selection.json") -> Dict[str, Any]:
     """
     Loads Cybermed selection policy config from JSON.
@@ -49,10 +65,16 @@ def load_cybermed_selection_config(path: str = "data/cybermed_selection.json") -
         return {"enabled": False}
 
     try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         with open(path, "r", encoding="utf-8") as f:
             cfg = json.load(f)
         if not isinstance(cfg, dict):
             return {"enabled": False}
+        _CONFIG_CACHE[path] = (stamp, cfg)
         return cfg
     except FileNotFoundError:
         return {"enabled": False}
@@ -60,15 +82,16 @@ def load_cybermed_selection_config(path: str = "data/cybermed_selection.json") -
         return {"enabled": False}
 
 
-def _norm(s: str) -> str:
-    return (s or "").strip().lower()
+# Every ASCII byte except [a-z0-9]; after lower() and dropping non-ASCII this equals re.sub(r"[^a-z0-9]+", "", ...).
+_JOURNAL_DROP_BYTES = bytes(b for b in range(128) if not (48 <= b <= 57 or 97 <= b <= 122))
 
 
+@lru_cache(maxsize=4096)
 def _normalize_journal_token(s: str) -> str:
     base = (s or "").strip().lower()
     if not base:
         return ""
-    return re.sub(r"[^a-z0-9]+", "", base)
+    return base.encode("ascii", "ignore").translate(None, _JOURNAL_DROP_BYTES).decode("ascii")
 
 
 def _journal_candidates(item: Dict[str, Any]) -> List[str]:
@@ -88,98 +111,254 @@ def _journal_candidates(item: Dict[str, Any]) -> List[str]:
     return candidates
 
 
-def _journal_matches(item: Dict[str, Any], names: List[str] | set[str]) -> bool:
-    normalized_targets = {
-        _normalize_journal_token(str(x)) for x in names if _normalize_journal_token(str(x))
-    }
-    if not normalized_targets:
-        return False
-
-    for cand in _journal_candidates(item):
-        if _normalize_journal_token(cand) in normalized_targets:
-            return True
-
-    return False
+def _journal_tokens(item: Dict[str, Any]) -> frozenset[str]:
+    # Normalized journal names of one item; computed once and matched against every journal list.
+    return frozenset(tok for tok in map(_normalize_journal_token, _journal_candidates(item)) if tok)
 
 
-def _journal_tier(item: Dict[str, Any], tiers: Dict[str, Any]) -> str:
-    if not isinstance(tiers, dict):
-        return ""
+def _journal_target_tokens(names: Any) -> frozenset[str]:
+    if not isinstance(names, (list, set, frozenset, tuple)):
+        return frozenset()
+    return frozenset(tok for tok in (_normalize_journal_token(str(x)) for x in names) if tok)
 
-    for tier_name, journals in tiers.items():
-        if isinstance(journals, list) and _journal_matches(item, journals):
-            return str(tier_name)
 
-    return ""
+def _journal_tier(item_tokens: frozenset[str], tiers: Dict[str, frozenset[str]]) -> str:
+    # ``tiers`` maps tier names to precomputed _journal_target_tokens sets; first match wins.
+    return next((str(name) for name, journals in tiers.items() if not item_tokens.isdisjoint(journals)), "")
 
 
 def _text_haystack(item: Dict[str, Any]) -> str:
     # Keep bounded to avoid large prompts/logging overhead; selector only needs signals.
+    # Built once per item by the selectors and shared by every keyword scan and regex check.
     title = str(item.get("title") or "")
     journal = str(item.get("journal") or item.get("channel") or "")
     text = str(item.get("text") or item.get("summary") or "")
     return f"{title}\n{journal}\n{text[:2000]}".lower()
 
 
-def _matches_any_regex(text: str, patterns: List[str]) -> bool:
+def _compile_patterns(patterns: List[Any]) -> List[re.Pattern[str]]:
+    compiled: List[re.Pattern[str]] = []
     for p in patterns:
         try:
-            if re.search(p, text, flags=re.IGNORECASE):
-                return True
+            compiled.append(re.compile(str(p), re.IGNORECASE))
         except re.error:
             # Ignore invalid regex patterns (config safety)
             continue
+    # One alternation scans the text once instead of once per pattern. Patterns with groups stay
+    # separate (joining them would renumber backreferences), as do ones that only compile alone
+    # (e.g. leading global flags).
+    if len(compiled) > 1 and all(p.groups == 0 for p in compiled):
+        try:
+            return [re.compile("|".join(f"(?:{p.pattern})" for p in compiled), re.IGNORECASE)]
+        except re.error:
+            pass
+    return compiled
+
+
+def _matches_any_regex(text: str, patterns: List[re.Pattern[str]]) -> bool:
+    for p in patterns:
+        if p.search(text):
+            return True
     return False
 
 
-def _contains_any_keyword(text: str, keywords: List[str]) -> bool:
-    t = text.lower()
-    for k in keywords:
-        kk = (k or "").strip().lower()
-        if not kk:
-            continue
-        if kk in t:
+def _regex_searchers(patterns: List[re.Pattern[str]]) -> Tuple[Callable[[str], Any], ...]:
+    # Bound ``search`` methods for the per-item loop; pairs with _search_any.
+    return tuple(p.search for p in patterns)
+
+
+@lru_cache(maxsize=128)
+def _cached_searchers(patterns: Tuple[str, ...]) -> Tuple[Callable[[str], Any], ...]:
+    return _regex_searchers(_compile_patterns(list(patterns)))
+
+
+def _pattern_searchers(patterns: List[Any]) -> Tuple[Callable[[str], Any], ...]:
+    # Compiled once per distinct pattern list, shared across runs and by lists repeated in one config.
+    return _cached_searchers(tuple(str(p) for p in patterns))
+
+
+def _search_any(text: str, searchers: Tuple[Callable[[str], Any], ...]) -> bool:
+    for search in searchers:
+        if search(text):
             return True
     return False
 
 
-def _domain_signals(hay: str, cfg: Dict[str, Any]) -> Tuple[bool, Dict[str, bool]]:
-    if not isinstance(cfg, dict):
-        return False, {}
+@dataclass(frozen=True)
+class _KeywordSet:
+    keywords: Tuple[str, ...]
+    automaton: Any = None
+    prefix_patterns: Tuple[re.Pattern[str], ...] = ()
+
+    def hit(self, text: str) -> bool:
+        # Expects already lower-cased text (a _text_haystack or a lowered field). Matching stays substring
+        # based ("icu" hits "picu"), so a word-token set cannot stand in for single-word keywords.
+        if self.automaton is not None:
+            for _ in self.automaton.iter(text):
+                return True
+            return False
+        if self.prefix_patterns:
+            for p in self.prefix_patterns:
+                if p.search(text):
+                    return True
+            return False
+        for k in self.keywords:
+            if k in text:
+                return True
+        return False
 
-    flags: Dict[str, bool] = {}
-    for name, kws in cfg.items():
-        flags[name] = _contains_any_keyword(hay, [str(x) for x in kws]) if isinstance(kws, list) else False
 
-    return any(flags.values()), flags
+def _prefix_grouped_patterns(kws: Tuple[str, ...]) -> Tuple[re.Pattern[str], ...]:
+    # Without pyahocorasick, large lists are matched as one literal regex per leading character
+    # ("s(?:epsis|eptic shock)"): the regex engine skips ahead to that character, which beats one
+    # substring scan per keyword once keywords share first letters. Otherwise keep the plain loop.
+    groups: Dict[str, List[str]] = {}
+    for k in kws:
+        groups.setdefault(k[0], []).append(re.escape(k[1:]))
+    if len(groups) * 2 > len(kws):
+        return ()
+    return tuple(re.compile(f"{re.escape(first)}(?:{'|'.join(rest)})") for first, rest in groups.items())
+
+
+# Keyword sets built from config lists, keyed by id() of the list. The cached config (see
+# load_cybermed_selection_config) hands out the same list objects on every run, so repeated
+# selections skip re-normalizing and re-building automatons. Entries keep the list alive (no id
+# reuse), a snapshot of its contents (so in-place edits are noticed) and the automaton backend used.
+_KEYWORD_SET_CACHE: Dict[int, Tuple[List[Any], List[Any], Any, _KeywordSet]] = {}
+_KEYWORD_SET_CACHE_MAX = 256
+# Shared by every missing or blank keyword list, so such lists keep a stable identity across runs.
+_EMPTY_KEYWORD_SET = _KeywordSet(())
+
+
+def _keyword_set(keywords: Any) -> _KeywordSet:
+    # Keywords are stripped, lower-cased and de-duplicated once per list instead of per item.
+    if not isinstance(keywords, list):
+        keywords = []
+    cached = _KEYWORD_SET_CACHE.get(id(keywords))
+    if cached is not None and cached[0] is keywords and cached[2] is ahocorasick and cached[1] == keywords:
+        return cached[3]
+    kws = tuple(dict.fromkeys(k for k in (str(x).strip().lower() for x in keywords) if k))
+    if not kws:
+        return _EMPTY_KEYWORD_SET
+    automaton = None
+    prefix_patterns: Tuple[re.Pattern[str], ...] = ()
+    if ahocorasick is not None and len(kws) >= _AUTOMATON_MIN_KEYWORDS:
+        automaton = ahocorasick.Automaton()
+        for k in kws:
+            automaton.add_word(k, k)
+        automaton.make_automaton()
+    elif len(kws) >= _AUTOMATON_MIN_KEYWORDS:
+        prefix_patterns = _prefix_grouped_patterns(kws)
+    kw_set = _KeywordSet(kws, automaton, prefix_patterns)
+    if keywords:
+        if len(_KEYWORD_SET_CACHE) >= _KEYWORD_SET_CACHE_MAX:
+            _KEYWORD_SET_CACHE.clear()
+        _KEYWORD_SET_CACHE[id(keywords)] = (keywords, list(keywords), ahocorasick, kw_set)
+    return kw_set
+
+
+class _TextHits:
+    # Keyword-set hits for one haystack. After a fused scan, ``mask`` has one bit per scanned set;
+    # sets outside the scan (or no scan at all) fall back to their own substring check.
+    __slots__ = ("text", "mask", "bits")
+
+    def __init__(self, text: str, mask: int | None = None, bits: Dict[int, int] | None = None) -> None:
+        self.text = text
+        self.mask = mask
+        self.bits = bits
+
+    def hit(self, kw: _KeywordSet) -> bool:
+        if self.mask is not None:
+            bit = self.bits.get(id(kw))
+            if bit is not None:
+                return bool(self.mask & bit)
+        return kw.hit(self.text)
+
+
+class _KeywordScanner:
+    # One Aho-Corasick automaton over the keywords of many sets, each keyword tagged with the bit
+    # mask of the sets containing it, so a single pass over the haystack answers every set.
+    def __init__(self, keyword_sets: List[_KeywordSet]) -> None:
+        self._sets: List[_KeywordSet] = []
+        self.bits: Dict[int, int] = {}
+        words: Dict[str, int] = {}
+        for kw in keyword_sets:
+            if id(kw) in self.bits:
+                continue
+            bit = 1 << len(self._sets)
+            self._sets.append(kw)
+            self.bits[id(kw)] = bit
+            for k in kw.keywords:
+                words[k] = words.get(k, 0) | bit
+        self.full_mask = 0
+        for mask in words.values():
+            self.full_mask |= mask
+        self.automaton = None
+        if ahocorasick is not None and len(words) >= _AUTOMATON_MIN_KEYWORDS:
+            self.automaton = ahocorasick.Automaton()
+            for k, mask in words.items():
+                self.automaton.add_word(k, mask)
+            self.automaton.make_automaton()
+
+    def scan(self, text: str) -> _TextHits:
+        # ``text`` is already lower-case, as for _KeywordSet.hit.
+        # Without an automaton, sets are checked lazily as they are asked for; one combined
+        # lookahead regex over all keywords measured ~6x slower than plain `in` scans.
+        if self.automaton is None:
+            return _TextHits(text)
+        mask = 0
+        full_mask = self.full_mask
+        for _, found in self.automaton.iter(text):
+            mask |= found
+            if mask == full_mask:
+                break
+        return _TextHits(text, mask, self.bits)
+
+
+# Scanners keyed by the identities of their keyword sets, which _keyword_set keeps stable while the
+# config lists are unchanged. Entries hold the sets (no id reuse) and the automaton backend used.
+_KEYWORD_SCANNER_CACHE: Dict[Tuple[int, ...], Tuple[Tuple[_KeywordSet, ...], Any, _KeywordScanner]] = {}
+_KEYWORD_SCANNER_CACHE_MAX = 32
 
 
-def _clinical_intent(hay: str, cfg: Dict[str, Any]) -> Tuple[bool, Dict[str, bool]]:
-    if not isinstance(cfg, dict):
-        return False, {}
+def _keyword_scanner(keyword_sets: List[_KeywordSet]) -> _KeywordScanner:
+    key = tuple(id(kw) for kw in keyword_sets)
+    cached = _KEYWORD_SCANNER_CACHE.get(key)
+    if cached is not None and cached[1] is ahocorasick:
+        return cached[2]
+    scanner = _KeywordScanner(keyword_sets)
+    if len(_KEYWORD_SCANNER_CACHE) >= _KEYWORD_SCANNER_CACHE_MAX:
+        _KEYWORD_SCANNER_CACHE.clear()
+    _KEYWORD_SCANNER_CACHE[key] = (tuple(keyword_sets), ahocorasick, scanner)
+    return scanner
+
+
+def _domain_signals(hits: _TextHits, keyword_sets: Dict[str, _KeywordSet]) -> Tuple[bool, Dict[str, bool]]:
+    flags: Dict[str, bool] = {}
+    for name, kws in keyword_sets.items():
+        flags[name] = hits.hit(kws)
+
+    return any(flags.values()), flags
 
-    design_kw = cfg.get("design", []) if isinstance(cfg.get("design"), list) else []
-    clinical_kw = cfg.get("clinical", []) if isinstance(cfg.get("clinical"), list) else []
 
-    design = _contains_any_keyword(hay, [str(x) for x in design_kw])
-    clinical = _contains_any_keyword(hay, [str(x) for x in clinical_kw])
+def _clinical_intent(hits: _TextHits, design_kw: _KeywordSet, clinical_kw: _KeywordSet) -> Tuple[bool, Dict[str, bool]]:
+    design = hits.hit(design_kw)
+    clinical = hits.hit(clinical_kw)
 
     return design or clinical, {"design": design, "clinical": clinical}
 
 
 def _pain_scope(
-    hay: str,
-    sel_cfg: Dict[str, Any],
+    hits: _TextHits,
+    pain_kw: _KeywordSet,
+    context_kw: _KeywordSet,
     domain_flags: Dict[str, bool],
     clinical_intent: bool,
     *,
     requires_keywords: bool = True,
 ) -> Tuple[bool, Dict[str, bool]]:
-    pain_kw = sel_cfg.get("pain_strict_keywords", []) if isinstance(sel_cfg.get("pain_strict_keywords"), list) else []
-    context_kw = sel_cfg.get("pain_strict_context_keywords", []) if isinstance(sel_cfg.get("pain_strict_context_keywords"), list) else []
-
-    pain_signal = _contains_any_keyword(hay, [str(x) for x in pain_kw])
-    context_signal = _contains_any_keyword(hay, [str(x) for x in context_kw])
+    pain_signal = hits.hit(pain_kw)
+    context_signal = hits.hit(context_kw)
     periop_context = domain_flags.get("anesthesia_periop", False) or domain_flags.get("emergency_resus", False)
     icu_context = domain_flags.get("icu_ccm", False)
 
@@ -199,80 +378,119 @@ def _pain_scope(
     }
 
 
-def _journal_name(item: Dict[str, Any]) -> str:
-    candidates = _journal_candidates(item)
-    return candidates[0] if candidates else ""
+_N_EQ_RE = re.compile(r"\bn\s*[=:]\s*(\d{2,5})", re.IGNORECASE)
+_N_NOUN_RE = re.compile(
+    r"(\d{2,5})\s+(patients|participants|subjects|cases|adults|children|neonates|infants)",
+    re.IGNORECASE,
+)
+
+
+_N_NOUN_STEMS = ("patients", "participants", "subjects", "cases", "adults", "children", "neonates", "infants")
 
 
 def _extract_sample_size(hay: str) -> int:
+    # ``hay`` is the lowercased haystack; cheap substring checks skip the regexes on most abstracts.
     # Try structured patterns first (e.g., "n=1234")
-    direct_match = re.search(r"\bn\s*[=:]\s*(\d{2,5})", hay, flags=re.IGNORECASE)
+    direct_match = _N_EQ_RE.search(hay) if ("=" in hay or ":" in hay) else None
     if direct_match:
         return int(direct_match.group(1))
 
+    # Non-ASCII text always goes to the regex: IGNORECASE also matches e.g. "ı" against "i".
+    if hay.isascii() and not any(stem in hay for stem in _N_NOUN_STEMS):
+        return 0
+
     # Heuristic: number followed by population noun
-    noun_match = re.search(
-        r"(\d{2,5})\s+(patients|participants|subjects|cases|adults|children|neonates|infants)",
-        hay,
-        flags=re.IGNORECASE,
-    )
+    noun_match = _N_NOUN_RE.search(hay)
     if noun_match:
         return int(noun_match.group(1))
 
     return 0
 
 
+@dataclass(frozen=True)
+class _DeepDiveCtx:
+    w_study: float
+    w_pubtype: float
+    w_power: float
+    w_sample: float
+    w_predictive: float
+    w_clinical: float
+    w_downrank: float
+    study_design_kw: _KeywordSet
+    publication_types_kw: Tuple[str, ...]
+    publication_types_kw_set: frozenset[str]
+    power_kw: _KeywordSet
+    predictive_kw: _KeywordSet
+    clinical_kw: _KeywordSet
+    downrank_kw: _KeywordSet
+    preclinical_kw: _KeywordSet
+    editorial_kw: _KeywordSet
+
+
+def _build_dd_ctx(cfg: Dict[str, Any]) -> _DeepDiveCtx:
+    # Deep-dive weights and keyword lists are parsed once per run, not once per candidate.
+    dd_cfg = cfg.get("deep_dive_scoring", {}) if isinstance(cfg.get("deep_dive_scoring"), dict) else {}
+    weights = dd_cfg.get("weights", {}) if isinstance(dd_cfg.get("weights"), dict) else {}
+
+    pub_types_kw = dd_cfg.get("publication_type_signals", [])
+    pub_types_kw = tuple(str(x).lower() for x in pub_types_kw) if isinstance(pub_types_kw, list) else ()
+    return _DeepDiveCtx(
+        w_study=float(weights.get("study_design", 3.0)),
+        w_pubtype=float(weights.get("publication_type", 2.5)),
+        w_power=float(weights.get("power", 1.5)),
+        w_sample=float(weights.get("sample_size", 1.2)),
+        w_predictive=float(weights.get("predictive", 1.5)),
+        w_clinical=float(weights.get("clinical_relevance", 1.0)),
+        w_downrank=float(weights.get("downrank", -1.5)),
+        study_design_kw=_keyword_set(dd_cfg.get("study_design_signals")),
+        publication_types_kw=pub_types_kw,
+        publication_types_kw_set=frozenset(pub_types_kw),
+        power_kw=_keyword_set(dd_cfg.get("power_signals")),
+        predictive_kw=_keyword_set(dd_cfg.get("predictive_value_signals")),
+        clinical_kw=_keyword_set(dd_cfg.get("clinical_relevance_keywords")),
+        downrank_kw=_keyword_set(dd_cfg.get("downrank_signals")),
+        preclinical_kw=_keyword_set(dd_cfg.get("preclinical_penalty_signals")),
+        editorial_kw=_keyword_set(dd_cfg.get("editorial_penalty_signals")),
+    )
+
+
 def _deep_dive_score(
     item: Dict[str, Any],
     hay: str,
-    cfg: Dict[str, Any],
+    ctx: _DeepDiveCtx,
     *,
     domain_flags: Dict[str, bool],
-    high_journals: set[str] | None = None,
+    high_journal_hit: bool = False,
     additional_penalty: float = 0.0,
+    hits: _TextHits | None = None,
 ) -> Tuple[float, List[str]]:
-    dd_cfg = cfg.get("deep_dive_scoring", {}) if isinstance(cfg.get("deep_dive_scoring"), dict) else {}
-    weights = dd_cfg.get("weights", {}) if isinstance(dd_cfg.get("weights"), dict) else {}
-
-    w_study = float(weights.get("study_design", 3.0))
-    w_pubtype = float(weights.get("publication_type", 2.5))
-    w_power = float(weights.get("power", 1.5))
-    w_sample = float(weights.get("sample_size", 1.2))
-    w_predictive = float(weights.get("predictive", 1.5))
-    w_clinical = float(weights.get("clinical_relevance", 1.0))
-    w_downrank = float(weights.get("downrank", -1.5))
-
-    def _kw_list(key: str) -> List[str]:
-        val = dd_cfg.get(key, [])
-        return [str(x) for x in val] if isinstance(val, list) else []
-
-    study_design_kw = _kw_list("study_design_signals")
-    publication_types_kw = [s.lower() for s in _kw_list("publication_type_signals")]
-    power_kw = _kw_list("power_signals")
-    predictive_kw = _kw_list("predictive_value_signals")
-    clinical_kw = _kw_list("clinical_relevance_keywords")
-    downrank_kw = _kw_list("downrank_signals")
-    preclinical_kw = _kw_list("preclinical_penalty_signals")
-    editorial_kw = _kw_list("editorial_penalty_signals")
-
+    if hits is None:
+        hits = _TextHits(hay)
+    w_study = ctx.w_study
+    w_pubtype = ctx.w_pubtype
+    w_power = ctx.w_power
+    w_sample = ctx.w_sample
+    w_predictive = ctx.w_predictive
+    w_clinical = ctx.w_clinical
+    w_downrank = ctx.w_downrank
     reasons: List[str] = []
     score = 0.0
 
-    if _contains_any_keyword(hay, study_design_kw):
+    if hits.hit(ctx.study_design_kw):
         score += w_study
         reasons.append("design_signal")
 
     pub_types = item.get("publication_types")
     if isinstance(pub_types, list):
         normalized_pub_types = {str(x).strip().lower() for x in pub_types}
-        for pt in publication_types_kw:
-            if pt.lower() in normalized_pub_types:
-                score += w_pubtype
-                reasons.append(f"pubtype:{pt}")
-                break
+        if not normalized_pub_types.isdisjoint(ctx.publication_types_kw_set):
+            # Report the first configured signal that matched, as before.
+            pt = next(pt for pt in ctx.publication_types_kw if pt in normalized_pub_types)
+            score += w_pubtype
+            reasons.append(f"pubtype:{pt}")
 
     n = _extract_sample_size(hay)
-    power_hit = _contains_any_keyword(hay, power_kw)
+    power_hit = hits.hit(ctx.power_kw)
     if n > 0:
         size_score = min(3.0, n / 500.0) * w_sample
         score += size_score
@@ -285,28 +503,29 @@ def _deep_dive_score(
         score += w_power
         reasons.append("power_kw")
 
-    if _contains_any_keyword(hay, predictive_kw):
+    if hits.hit(ctx.predictive_kw):
         score += w_predictive
         reasons.append("predictive_signal")
 
-    if _contains_any_keyword(hay, clinical_kw):
+    if hits.hit(ctx.clinical_kw):
         score += w_clinical
         reasons.append("clinical_relevance")
 
-    if _contains_any_keyword(hay, downrank_kw):
+    if hits.hit(ctx.downrank_kw):
         score += w_downrank
         reasons.append("downrank_signal")
 
-    if _contains_any_keyword(hay, preclinical_kw):
+    preclinical_hit = hits.hit(ctx.preclinical_kw)
+    if preclinical_hit:
         score += w_downrank * 1.2
         reasons.append("preclinical_penalty")
 
-    if _contains_any_keyword(hay, editorial_kw):
+    if hits.hit(ctx.editorial_kw):
         score += w_downrank
         reasons.append("editorial_penalty")
 
-    if high_journals and _journal_matches(item, high_journals):
-        if _contains_any_keyword(hay, preclinical_kw):
+    if high_journal_hit:
+        if preclinical_hit:
             score += w_downrank * 0.8
             reasons.append("high_impact_preclinical_penalty")
 
@@ -368,7 +587,31 @@ def _content_length_bucket(length: int) -> str:
         return "medium"
     return "long"
 
-def _pubmed_v1_scores(item: Dict[str, Any], hay: str, domain_flags: Dict[str, bool]) -> Tuple[Dict[str, float], List[str], List[str], str | None, bool]:
+# Fixed v1 scoring vocabularies, normalized once at import rather than per keyword per item.
+_V1_TRIAL_DESIGN_KW = _keyword_set(["prospective cohort","diagnostic accuracy","randomized","clinical trial"])
+_V1_PRECLINICAL_KW = _keyword_set(["animal","murine","in vitro","preclinical","basic science"])
+_V1_CLINICAL_TERMS = ("mortality","intubation","airway","ventilation","ards","sepsis","septic shock","vasopressor","resuscitation","cardiac arrest","trauma","anesthesia safety","perioperative","regional anesthesia","analgesia","icu length of stay","delirium","sedation","antimicrobial","infection","hemodynamic")
+_V1_GUIDELINE_KW = _keyword_set(["guideline","consensus","recommendation"])
+_V1_RCT_KW = _keyword_set(["randomized","rct"])
+_V1_SYSTEMATIC_REVIEW_KW = _keyword_set(["systematic review","meta-analysis"])
+_V1_OUTCOME_KW = _keyword_set(["mortality","length of stay","safety","adverse event"])
+_V1_HIGH_IMPACT_JOURNAL_KW = _keyword_set(["nejm","jama","lancet","bmj"])
+_V1_NON_CLINICAL_KW = _keyword_set(["marketing","stock market","sports betting","cryptocurrency"])
+# The sets matched against the haystack (the journal set is matched against the journal name).
+_V1_HAYSTACK_KEYWORD_SETS = (
+    _V1_TRIAL_DESIGN_KW,
+    _V1_PRECLINICAL_KW,
+    _V1_GUIDELINE_KW,
+    _V1_RCT_KW,
+    _V1_SYSTEMATIC_REVIEW_KW,
+    _V1_OUTCOME_KW,
+    _V1_NON_CLINICAL_KW,
+)
+
+
+def _pubmed_v1_scores(item: Dict[str, Any], hay: str, domain_flags: Dict[str, bool], hits: _TextHits | None = None) -> Tuple[Dict[str, float], List[str], List[str], str | None, bool]:
+    if hits is None:
+        hits = _TextHits(hay)
     reasons: List[str] = []
     penalties: List[str] = []
     hard_exclusion: str | None = None
@@ -391,24 +634,23 @@ def _pubmed_v1_scores(item: Dict[str, Any], hay: str, domain_flags: Dict[str, bo
             penalties.append("evidence_tag_overridden_by_publication_type")
         else:
             evidence += 3.0; reasons.append("high_evidence_publication_type")
-    if _contains_any_keyword(hay,["prospective cohort","diagnostic accuracy","randomized","clinical trial"]):
+    if hits.hit(_V1_TRIAL_DESIGN_KW):
         evidence += 1.5
     if pub_types & LOW_PRIORITY_PUB_TYPES:
         evidence -= 1.5; penalties.append("publication_type_low_priority")
-    if _contains_any_keyword(hay,["animal","murine","in vitro","preclinical","basic science"]):
+    if hits.hit(_V1_PRECLINICAL_KW):
         evidence -= 1.5; penalties.append("possible_offtopic")
 
-    clinical_terms=["mortality","intubation","airway","ventilation","ards","sepsis","septic shock","vasopressor","resuscitation","cardiac arrest","trauma","anesthesia safety","perioperative","regional anesthesia","analgesia","icu length of stay","delirium","sedation","antimicrobial","infection","hemodynamic"]
-    clinical_hits=sum(1 for t in clinical_terms if t in hay)
+    clinical_hits=sum(1 for t in _V1_CLINICAL_TERMS if t in hay)
     clinical += min(4.0, clinical_hits*0.7)
     if any(domain_flags.values()): clinical += 1.0; reasons.append("strong_clinical_relevance")
     if clinical < 1.0: penalties.append("low_clinical_relevance")
 
-    if _contains_any_keyword(hay,["guideline","consensus","recommendation"]): practice += 2.0; reasons.append("guideline_or_consensus")
-    if _contains_any_keyword(hay,["randomized","rct"]): practice += 1.5; reasons.append("randomized_trial")
-    if _contains_any_keyword(hay,["systematic review","meta-analysis"]): practice += 1.5; reasons.append("systematic_review_or_meta_analysis")
-    if _contains_any_keyword(hay,["mortality","length of stay","safety","adverse event"]): practice += 1.0; reasons.append("patient_centered_outcomes")
-    if _contains_any_keyword(journal,["nejm","jama","lancet","bmj"]): practice += 0.8; reasons.append("high_impact_journal")
+    if hits.hit(_V1_GUIDELINE_KW): practice += 2.0; reasons.append("guideline_or_consensus")
+    if hits.hit(_V1_RCT_KW): practice += 1.5; reasons.append("randomized_trial")
+    if hits.hit(_V1_SYSTEMATIC_REVIEW_KW): practice += 1.5; reasons.append("systematic_review_or_meta_analysis")
+    if hits.hit(_V1_OUTCOME_KW): practice += 1.0; reasons.append("patient_centered_outcomes")
+    if _V1_HIGH_IMPACT_JOURNAL_KW.hit(journal): practice += 0.8; reasons.append("high_impact_journal")
 
     if has_content: text_conf += 1.0
     if source in {"pubmed_abstract","pmc_oa_fulltext","unpaywall_fulltext"}: text_conf += 0.7
@@ -422,7 +664,7 @@ def _pubmed_v1_scores(item: Dict[str, Any], hay: str, domain_flags: Dict[str, bo
     if evidence <= 0.5:
         penalties.append("low_evidence_strength")
 
-    if _contains_any_keyword(hay,["marketing","stock market","sports betting","cryptocurrency"]):
+    if hits.hit(_V1_NON_CLINICAL_KW):
         hard_exclusion="clearly_non_clinical"
 
     total = evidence + clinical + practice + text_conf
@@ -433,64 +675,112 @@ def _domain_key_for_quota(flags: Dict[str, bool]) -> str:
     return active[0] if active else "general"
 
 
-def _score_item(
-    item: Dict[str, Any], cfg: Dict[str, Any], *, haystack: str | None = None
-) -> Tuple[float, List[str]]:
+@dataclass(frozen=True)
+class _ScoreCtx:
+    exclude_title_search: Tuple[Callable[[str], Any], ...]
+    core_journals: frozenset[str]
+    high_journals: frozenset[str]
+    cc_kw: _KeywordSet
+    an_kw: _KeywordSet
+    # Scoring constants, coerced once per run rather than per item.
+    exclude_title_penalty: float
+    min_abstract_chars: int
+    abstract_bonus: float
+    core_journal_bonus: float
+    high_impact_bonus: float
+    critical_care_bonus: float
+    anaesthesiology_bonus: float
+
+
+# Per-candidate facts captured when an item enters the overview pool; read back by the later passes.
+@dataclass(frozen=True, slots=True)
+class _PooledCandidate:
+    item: Dict[str, Any]
+    is_correction_or_commentary: bool
+    title_floor_blocked: bool
+    deep_sort_key: Tuple[float, float]
+
+
+def _build_score_ctx(cfg: Dict[str, Any]) -> _ScoreCtx:
     sel = cfg.get("selection", {}) if isinstance(cfg.get("selection"), dict) else {}
-    sc = cfg.get("scoring", {}) if isinstance(cfg.get("scoring"), dict) else {}
     kw = cfg.get("classification_keywords", {}) if isinstance(cfg.get("classification_keywords"), dict) else {}
+    sc = cfg.get("scoring", {}) if isinstance(cfg.get("scoring"), dict) else {}
+
+    exclude_patterns = sel.get("exclude_title_regex", [])
+    tiers = sel.get("tiers", {}) if isinstance(sel.get("tiers"), dict) else {}
+    tier1 = tiers.get("tier1_core_clinical", []) if isinstance(tiers.get("tier1_core_clinical"), list) else []
+    tier2 = tiers.get("tier2_general_high_impact", []) if isinstance(tiers.get("tier2_general_high_impact"), list) else []
+
+    return _ScoreCtx(
+        exclude_title_search=_pattern_searchers(exclude_patterns) if isinstance(exclude_patterns, list) else (),
+        core_journals=_journal_target_tokens(sel.get("core_journals", tier1)),
+        high_journals=_journal_target_tokens(sel.get("high_impact_journals", tier2)),
+        cc_kw=_keyword_set(kw.get("critical_care")),
+        an_kw=_keyword_set(kw.get("anaesthesiology")),
+        exclude_title_penalty=float(sc.get("exclude_title_penalty", -5.0)),
+        min_abstract_chars=int(sel.get("min_abstract_chars", 0) or 0),
+        abstract_bonus=float(sc.get("has_reasonable_abstract_bonus", 1.0)),
+        core_journal_bonus=float(sc.get("journal_core_bonus", 2.0)),
+        high_impact_bonus=float(sc.get("journal_high_impact_bonus", 2.0)),
+        critical_care_bonus=float(sc.get("critical_care_bonus", 0.5)),
+        anaesthesiology_bonus=float(sc.get("anaesthesiology_bonus", 0.5)),
+    )
+
+
+def _score_item(
+    item: Dict[str, Any],
+    cfg: Dict[str, Any],
+    *,
+    haystack: str | None = None,
+    ctx: _ScoreCtx | None = None,
+    journal_tokens: frozenset[str] | None = None,
+    hits: _TextHits | None = None,
+) -> Tuple[float, List[str]]:
+    # ``ctx``, ``journal_tokens`` and ``hits`` let the selection loop pass in what it already computed.
+    if ctx is None:
+        ctx = _build_score_ctx(cfg)
+    if journal_tokens is None:
+        journal_tokens = _journal_tokens(item)
 
     reasons: List[str] = []
     score = 0.0
 
     title = str(item.get("title") or "")
     hay = haystack if haystack is not None else _text_haystack(item)
+    if hits is None:
+        hits = _TextHits(hay)
 
-    exclude_patterns = sel.get("exclude_title_regex", [])
-    if isinstance(exclude_patterns, list) and _matches_any_regex(title, [str(x) for x in exclude_patterns]):
-        penalty = float(sc.get("exclude_title_penalty", -5.0))
+    if _search_any(title, ctx.exclude_title_search):
+        penalty = ctx.exclude_title_penalty
         score += penalty
         reasons.append(f"exclude_title_penalty({penalty})")
 
     # Abstract length heuristic
-    min_abs_chars = int(sel.get("min_abstract_chars", 0) or 0)
-    text = str(item.get("text") or "")
-    if min_abs_chars > 0 and len(text.strip()) >= min_abs_chars:
-        bonus = float(sc.get("has_reasonable_abstract_bonus", 1.0))
+    min_abs_chars = ctx.min_abstract_chars
+    if min_abs_chars > 0 and len(str(item.get("text") or "").strip()) >= min_abs_chars:
+        bonus = ctx.abstract_bonus
         score += bonus
         reasons.append(f"abstract_len_bonus(+{bonus})")
 
     # Journal bonuses (safe, offline)
-    tiers = sel.get("tiers", {}) if isinstance(sel.get("tiers"), dict) else {}
-    tier1 = tiers.get("tier1_core_clinical", []) if isinstance(tiers.get("tier1_core_clinical"), list) else []
-    tier2 = tiers.get("tier2_general_high_impact", []) if isinstance(tiers.get("tier2_general_high_impact"), list) else []
-
-    core = sel.get("core_journals", tier1)
-    high = sel.get("high_impact_journals", tier2)
-    core_set = {str(x).strip() for x in core} if isinstance(core, list) else set()
-    high_set = {str(x).strip() for x in high} if isinstance(high, list) else set()
-
-    if _journal_matches(item, core_set):
-        bonus = float(sc.get("journal_core_bonus", 2.0))
+    if not journal_tokens.isdisjoint(ctx.core_journals):
+        bonus = ctx.core_journal_bonus
         score += bonus
         reasons.append(f"core_journal(+{bonus})")
 
-    if _journal_matches(item, high_set):
-        bonus = float(sc.get("journal_high_impact_bonus", 2.0))
+    if not journal_tokens.isdisjoint(ctx.high_journals):
+        bonus = ctx.high_impact_bonus
         score += bonus
         reasons.append(f"high_impact_journal(+{bonus})")
 
     # Track bonuses (lightweight clinical relevance signal)
-    cc_kw = kw.get("critical_care", []) if isinstance(kw.get("critical_care"), list) else []
-    an_kw = kw.get("anaesthesiology", []) if isinstance(kw.get("anaesthesiology"), list) else []
-
-    if _contains_any_keyword(hay, [str(x) for x in cc_kw]):
-        bonus = float(sc.get("critical_care_bonus", 0.5))
+    if hits.hit(ctx.cc_kw):
+        bonus = ctx.critical_care_bonus
         score += bonus
         reasons.append(f"critical_care_signal(+{bonus})")
 
-    if _contains_any_keyword(hay, [str(x) for x in an_kw]):
-        bonus = float(sc.get("anaesthesiology_bonus", 0.5))
+    if hits.hit(ctx.an_kw):
+        bonus = ctx.anaesthesiology_bonus
         score += bonus
         reasons.append(f"anaesthesiology_signal(+{bonus})")
 
@@ -568,13 +858,62 @@ def select_cybermed_pubmed_items(
     hard_exclude_deep_raw = sel.get("hard_exclude_deep_dive_regex", [])
     hard_exclude_deep = [str(x) for x in hard_exclude_deep_raw] if isinstance(hard_exclude_deep_raw, list) else []
     deprioritize_title_patterns = sel.get("exclude_title_regex", []) if isinstance(sel.get("exclude_title_regex"), list) else []
-    pubtype_exclusions = (
-        sel.get("publication_type_exclusions", [])
-        if isinstance(sel.get("publication_type_exclusions"), list)
-        else []
+    # Compile config patterns up front instead of going through re's cache for every item.
+    hard_exclude_overview_search = _pattern_searchers(hard_exclude_overview)
+    # Likewise normalize each keyword list once (and build automata for long ones).
+    domain_keywords = {name: _keyword_set(kws) for name, kws in domain_cfg.items()}
+    intent_design_keywords = _keyword_set(intent_cfg.get("design"))
+    intent_clinical_keywords = _keyword_set(intent_cfg.get("clinical"))
+    pain_keywords = _keyword_set(sel.get("pain_strict_keywords"))
+    pain_context_keywords = _keyword_set(sel.get("pain_strict_context_keywords"))
+    score_ctx = _build_score_ctx(cfg)
+    dd_ctx = _build_dd_ctx(cfg)
+    # Every haystack keyword list of the run in one automaton: one pass per item instead of one per list.
+    keyword_scanner = _keyword_scanner(
+        [
+            *domain_keywords.values(),
+            intent_design_keywords,
+            intent_clinical_keywords,
+            pain_keywords,
+            pain_context_keywords,
+            score_ctx.cc_kw,
+            score_ctx.an_kw,
+            dd_ctx.study_design_kw,
+            dd_ctx.power_kw,
+            dd_ctx.predictive_kw,
+            dd_ctx.clinical_kw,
+            dd_ctx.downrank_kw,
+            dd_ctx.preclinical_kw,
+            dd_ctx.editorial_kw,
+            *_V1_HAYSTACK_KEYWORD_SETS,
+        ]
+    )
+    # Journal lists as normalized token sets; each item's tokens are then matched by set intersection.
+    core_tokens = _journal_target_tokens(core_set)
+    high_tokens = _journal_target_tokens(high_set)
+    tier_tokens = {
+        "tier1_core": _journal_target_tokens(tier1_list),
+        "tier2_high_impact": _journal_target_tokens(tier2_list),
+        "tier3_pain_strict": _journal_target_tokens(tier3_list),
+    }
+    # A day's feed has few distinct journals; tier and list hits are resolved once per journal.
+    journal_info_cache: Dict[frozenset[str], Tuple[bool, bool, str]] = {}
+    hard_exclude_deep_search = _pattern_searchers(hard_exclude_deep)
+    deprioritize_title_search = _pattern_searchers(deprioritize_title_patterns)
+    pubtype_exclusions = frozenset(
+        pt.lower()
+        for pt in (
+            sel.get("publication_type_exclusions", [])
+            if isinstance(sel.get("publication_type_exclusions"), list)
+            else []
+        )
     )
 
     overview_pool: List[Dict[str, Any]] = []
+    overview_sort_keys: List[Tuple[int, float, float]] = []
+    # Title/publication-type floor results and deep-dive sort key per pooled item (by id), reused by
+    # the top-pick and deep-dive passes instead of re-lowering titles and re-reading scores.
+    pooled: Dict[int, _PooledCandidate] = {}
     excluded_by_allowlist = 0
     excluded_overview_offtopic = 0
     below_threshold_overview = 0
@@ -623,7 +962,9 @@ def select_cybermed_pubmed_items(
     for it in pubmed_items:
         hay = _text_haystack(it)
 
-        if _matches_any_regex(hay, [str(x) for x in hard_exclude_overview]):
+        # Checked against the full haystack on purpose: a title-only pre-check would disagree for
+        # "$"-anchored or lookaround patterns, and the haystack is needed by every survivor anyway.
+        if _search_any(hay, hard_exclude_overview_search):
             excluded_overview_offtopic += 1
             hard_excluded_total += 1
             exclusion_reason_counts["configured_hard_exclusion"] += 1
@@ -634,22 +975,30 @@ def select_cybermed_pubmed_items(
         pubtype_penalty_hit = False
         if isinstance(pub_types_raw, list):
             normalized_pub_types = {str(x).strip().lower() for x in pub_types_raw}
-            pubtype_penalty_hit = any(pt.lower() in normalized_pub_types for pt in pubtype_exclusions)
+            pubtype_penalty_hit = not normalized_pub_types.isdisjoint(pubtype_exclusions)
         if pubtype_penalty_hit:
             publication_type_penalty_hits += 1
 
-        title_penalty_hit = _matches_any_regex(title, [str(x) for x in deprioritize_title_patterns])
+        title_penalty_hit = _search_any(title, deprioritize_title_search)
         if title_penalty_hit:
             title_penalty_hits += 1
 
-        tier = _journal_tier(it, {"tier1_core": tier1_list, "tier2_high_impact": tier2_list, "tier3_pain_strict": tier3_list})
-        if not tier and _journal_matches(it, core_set):
-            tier = "tier1_core_fallback"
-        elif not tier and _journal_matches(it, high_set):
-            tier = "tier2_high_impact_fallback"
+        journal_tokens = _journal_tokens(it)
+        journal_info = journal_info_cache.get(journal_tokens)
+        if journal_info is None:
+            core_hit = not journal_tokens.isdisjoint(core_tokens)
+            high_hit = not journal_tokens.isdisjoint(high_tokens)
+            tier = _journal_tier(journal_tokens, tier_tokens)
+            if not tier and core_hit:
+                tier = "tier1_core_fallback"
+            elif not tier and high_hit:
+                tier = "tier2_high_impact_fallback"
+            journal_info = journal_info_cache[journal_tokens] = (core_hit, high_hit, tier)
+        core_hit, high_hit, tier = journal_info
         tier_counts[tier or "unclassified"] += 1
-        domain_any, domain_flags = _domain_signals(hay, domain_cfg)
-        clinical_intent, intent_flags = _clinical_intent(hay, intent_cfg)
+        hits = keyword_scanner.scan(hay)
+        domain_any, domain_flags = _domain_signals(hits, domain_keywords)
+        clinical_intent, intent_flags = _clinical_intent(hits, intent_design_keywords, intent_clinical_keywords)
         for flag, active in domain_flags.items():
             if active:
                 domain_signal_counts[str(flag)] += 1
@@ -657,14 +1006,15 @@ def select_cybermed_pubmed_items(
             if active:
                 clinical_intent_counts[str(flag)] += 1
         pain_ok, pain_flags = _pain_scope(
-            hay,
-            sel,
+            hits,
+            pain_keywords,
+            pain_context_keywords,
             domain_flags,
             clinical_intent,
             requires_keywords=pain_requires_keywords,
         )
 
-        v1_scores, v1_reasons, v1_penalties, v1_hard_exclusion, has_usable_content = _pubmed_v1_scores(it, hay, domain_flags)
+        v1_scores, v1_reasons, v1_penalties, v1_hard_exclusion, has_usable_content = _pubmed_v1_scores(it, hay, domain_flags, hits)
         pub_types = _pub_types(it)
         has_real_evidence_pubtype = _has_real_evidence_pubtype(pub_types)
         low_priority_only = _low_priority_only(pub_types)
@@ -685,7 +1035,7 @@ def select_cybermed_pubmed_items(
             floor_reasons.append("strong_domain_plus_usable_content")
         if float(v1_scores.get("practice",0.0)) > 0 and float(v1_scores.get("clinical",0.0)) > 0 and has_usable_content:
             floor_reasons.append("practice_and_clinical_with_content")
-        if float(v1_scores.get("clinical",0.0)) >= 3 and has_usable_content and ("journal article" in {p.lower() for p in pub_types}) and not low_priority_only:
+        if float(v1_scores.get("clinical",0.0)) >= 3 and has_usable_content and ("journal article" in pub_types) and not low_priority_only:
             floor_reasons.append("very_strong_clinical_journal_article")
         type_floor_passed = bool(floor_reasons)
         low_evidence_radar = (
@@ -740,37 +1090,27 @@ def select_cybermed_pubmed_items(
             exclusion_reason_counts["no_primary_evidence_signal"] += 1
             continue
         overview_eligible_after_type_floor_total += 1
+        for pen in v1_penalties:
+            soft_penalty_counts[pen] += 1
+
+        # Cheap exits first: scoring only runs for items that can still enter the pool.
+        if journal_mode == "strict" and core_set and not core_hit:
+            excluded_by_allowlist += 1
+            excluded_overview_offtopic += 1
+            continue
 
-        score, reasons = _score_item(it, cfg, haystack=hay)
+        score, reasons = _score_item(it, cfg, haystack=hay, ctx=score_ctx, journal_tokens=journal_tokens, hits=hits)
         score += float(v1_scores.get("total",0.0))
         reasons.extend(v1_reasons)
-        for pen in v1_penalties:
-            soft_penalty_counts[pen] += 1
         sc = cfg.get("scoring", {}) if isinstance(cfg.get("scoring"), dict) else {}
         if pubtype_penalty_hit:
             penalty = float(sc.get("publication_type_penalty", -1.5))
             score += penalty
             reasons.append(f"pubtype_penalty({penalty})")
-        deep_score, deep_reasons = _deep_dive_score(
-            it,
-            hay,
-            cfg,
-            domain_flags=domain_flags,
-            high_journals=high_set,
-            additional_penalty=(
-                float(sc.get("deep_dive_pubtype_penalty", -1.5)) if pubtype_penalty_hit else 0.0
-            )
-            + (float(sc.get("deep_dive_title_penalty", -1.0)) if title_penalty_hit else 0.0),
-        )
 
         include_by_tier = False
         tier_reason = ""
 
-        if journal_mode == "strict" and core_set and not _journal_matches(it, core_set):
-            excluded_by_allowlist += 1
-            excluded_overview_offtopic += 1
-            continue
-
         if tier in ("tier1_core", "tier1_core_clinical"):
             include_by_tier = True
             tier_reason = "tier1_core_default"
@@ -786,9 +1126,10 @@ def select_cybermed_pubmed_items(
             include_by_tier = pain_ok
             tier_reason = "tier3_pain_signal" if include_by_tier else "tier3_filtered"
         else:
-            include_by_tier = domain_any or clinical_intent or _journal_matches(it, core_set) or _journal_matches(it, high_set)
+            include_by_tier = domain_any or clinical_intent or core_hit or high_hit
             tier_reason = "untiered_domain" if include_by_tier else "untiered_filtered"
 
+        # Off-tier items are only penalised and can still clear the threshold, so they are scored too.
         if not include_by_tier:
             excluded_overview_offtopic += 1
             score -= 1.0
@@ -802,6 +1143,20 @@ def select_cybermed_pubmed_items(
             continue
         kept_after_soft_screen += 1
 
+        # Deep-dive scoring is only needed for items that made the overview pool.
+        deep_score, deep_reasons = _deep_dive_score(
+            it,
+            hay,
+            dd_ctx,
+            domain_flags=domain_flags,
+            high_journal_hit=high_hit,
+            additional_penalty=(
+                float(sc.get("deep_dive_pubtype_penalty", -1.5)) if pubtype_penalty_hit else 0.0
+            )
+            + (float(sc.get("deep_dive_title_penalty", -1.0)) if title_penalty_hit else 0.0),
+            hits=hits,
+        )
+
         selection_reasons = list(reasons)
         if tier_reason:
             selection_reasons.append(tier_reason)
@@ -812,30 +1167,35 @@ def select_cybermed_pubmed_items(
         if tier == "tier3_pain_strict" and any(pain_flags.values()):
             selection_reasons.append("pain_scope")
 
-        enriched = dict(it)
-        enriched["cybermed_score"] = score
-        enriched["cybermed_rank"] = len(overview_pool) + 1
-        enriched["cybermed_included"] = True
-        enriched["cybermed_deep_dive"] = False
-        enriched["cybermed_deep_dive_score"] = deep_score
-        enriched["cybermed_deep_dive_reasons"] = selection_reasons + deep_reasons
-        enriched["cybermed_selection_reasons"] = selection_reasons
-        enriched["cybermed_tier"] = tier or "unclassified"
-        enriched["cybermed_domain_flags"] = domain_flags
-        enriched["cybermed_clinical_intent"] = intent_flags
-        enriched["cybermed_pain_flags"] = pain_flags
-        enriched["evidence_strength_score"] = round(float(v1_scores.get("evidence",0.0)),3)
-        enriched["clinical_relevance_score"] = round(float(v1_scores.get("clinical",0.0)),3)
-        enriched["practice_changing_score"] = round(float(v1_scores.get("practice",0.0)),3)
-        enriched["content_length_bucket"] = _content_length_bucket(int(it.get("content_length") or len(str(it.get("text") or "").strip())))
-        enriched["has_usable_content"] = bool(has_usable_content)
-        enriched["reason_labels"] = list(dict.fromkeys((selection_reasons+v1_reasons+v1_penalties)))[:12]
+        reason_labels = list(dict.fromkeys((selection_reasons+v1_reasons+v1_penalties)))[:12]
         if low_priority_only and not has_real_evidence_pubtype and ("clinical_trial" in _evidence_tags(it)):
-            enriched["reason_labels"] = list(dict.fromkeys(enriched["reason_labels"] + ["evidence_tag_overridden_by_publication_type"]))
-        enriched["type_floor_passed"] = type_floor_passed
-        enriched["overview_eligible"] = type_floor_passed and not low_evidence_radar
-        enriched["low_evidence_radar"] = low_evidence_radar
-        enriched["floor_rejection_reason"] = "" if enriched["overview_eligible"] else (floor_block_reasons[0] if floor_block_reasons else ("low_evidence_commentary" if low_evidence_radar else "no_primary_evidence_signal"))
+            reason_labels = list(dict.fromkeys(reason_labels + ["evidence_tag_overridden_by_publication_type"]))
+        overview_eligible = type_floor_passed and not low_evidence_radar
+        # Copy and annotate in one dict build; the caller's item stays untouched.
+        enriched = {
+            **it,
+            "cybermed_score": score,
+            "cybermed_rank": len(overview_pool) + 1,
+            "cybermed_included": True,
+            "cybermed_deep_dive": False,
+            "cybermed_deep_dive_score": deep_score,
+            "cybermed_deep_dive_reasons": selection_reasons + deep_reasons,
+            "cybermed_selection_reasons": selection_reasons,
+            "cybermed_tier": tier or "unclassified",
+            "cybermed_domain_flags": domain_flags,
+            "cybermed_clinical_intent": intent_flags,
+            "cybermed_pain_flags": pain_flags,
+            "evidence_strength_score": round(float(v1_scores.get("evidence",0.0)),3),
+            "clinical_relevance_score": round(float(v1_scores.get("clinical",0.0)),3),
+            "practice_changing_score": round(float(v1_scores.get("practice",0.0)),3),
+            "content_length_bucket": _content_length_bucket(int(it.get("content_length") or len(str(it.get("text") or "").strip()))),
+            "has_usable_content": bool(has_usable_content),
+            "reason_labels": reason_labels,
+            "type_floor_passed": type_floor_passed,
+            "overview_eligible": overview_eligible,
+            "low_evidence_radar": low_evidence_radar,
+            "floor_rejection_reason": "" if overview_eligible else (floor_block_reasons[0] if floor_block_reasons else ("low_evidence_commentary" if low_evidence_radar else "no_primary_evidence_signal")),
+        }
         _attach_evidence_hint_labels(enriched, foamed=False)
         label = str(enriched.get("evidence_strength_label") or "").upper()
         d_label = label == "D"
@@ -860,9 +1220,7 @@ def select_cybermed_pubmed_items(
                 enriched["reason_labels"] = list(enriched.get("reason_labels", [])) + ["evidence_e_not_normal_paper"]
             low_evidence_radar_reason_counts["evidence_e_not_normal_paper"] += 1
 
-        enriched["cybermed_deep_dive_hard_excluded"] = _matches_any_regex(
-            hay, [str(x) for x in hard_exclude_deep]
-        )
+        enriched["cybermed_deep_dive_hard_excluded"] = _search_any(hay, hard_exclude_deep_search)
         if enriched["cybermed_deep_dive_hard_excluded"]:
             deep_dive_hard_excluded += 1
             enriched["cybermed_deep_dive_reasons"].append("hard_exclude_deep_dive")
@@ -877,16 +1235,16 @@ def select_cybermed_pubmed_items(
             included_high_impact += 1
 
         overview_pool.append(enriched)
+        pooled[id(enriched)] = _PooledCandidate(
+            enriched, is_correction_or_commentary, title_floor_blocked, (float(deep_score), float(score))
+        )
+        overview_sort_keys.append((_tier_priority(enriched["cybermed_tier"]), -float(score), -float(deep_score)))
 
     # Deep dive diversification and ranking
-    overview_sorted = sorted(
-        overview_pool,
-        key=lambda x: (
-            _tier_priority(str(x.get("cybermed_tier") or "")),
-            -float(x.get("cybermed_score", 0.0)),
-            -float(x.get("cybermed_deep_dive_score", 0.0)),
-        ),
-    )
+    # Sort keys were captured at insertion, so sorting never calls back into Python per item.
+    # A top-K heap does not fit here: every candidate gets a rank and a floor check below.
+    overview_order = sorted(range(len(overview_pool)), key=overview_sort_keys.__getitem__)
+    overview_sorted = [overview_pool[i] for i in overview_order]
 
     overview_items: List[Dict[str, Any]] = []
     final_context_radar_items: List[Dict[str, Any]] = []
@@ -919,9 +1277,8 @@ def select_cybermed_pubmed_items(
             and str(cand.get("content_length_bucket")) != "none"
         )
         ev_label = str(cand.get("evidence_strength_label") or "").upper()
-        has_real_evidence_pubtype = _has_real_evidence_pubtype(_pub_types(cand))
-        title_floor_blocked = bool(_title_correspondence_or_commentary_reasons(str(cand.get("title") or ""))) and not has_real_evidence_pubtype
-        if top_pick and (ev_label not in {"A", "B", "C"} or cand.get("low_evidence_radar") or not cand.get("type_floor_passed") or _is_correction_or_commentary_item(str(cand.get("title") or ""), _pub_types(cand))[0] or title_floor_blocked or str(cand.get("floor_rejection_reason") or "").strip()):
+        pooled_cand = pooled[id(cand)]
+        if top_pick and (ev_label not in {"A", "B", "C"} or cand.get("low_evidence_radar") or not cand.get("type_floor_passed") or pooled_cand.is_correction_or_commentary or pooled_cand.title_floor_blocked or str(cand.get("floor_rejection_reason") or "").strip()):
             top_pick = False
             top_pick_floor_rejection_counts["type_floor"] += 1
         if top_pick and float(cand.get("evidence_strength_score",0.0)) <= 0:
@@ -938,30 +1295,27 @@ def select_cybermed_pubmed_items(
         for sr in star_reasons: top_pick_reason_counts[sr]+=1
 
     deep_dive_items: List[Dict[str, Any]] = []
-    reason_counter: Counter[str] = Counter()
+    reason_counter: Dict[str, int] = {}
     dd_cfg = cfg.get("deep_dive_scoring", {}) if isinstance(cfg.get("deep_dive_scoring"), dict) else {}
     max_per_domain_dd = int(sel.get("max_per_domain_deep_dive", dd_cfg.get("max_per_domain", 3)) or 3)
 
+    # overview_items is already capped at max_overview, so this sort stays small.
     deep_candidates = sorted(
-        overview_items,
-        key=lambda x: (
-            float(x.get("cybermed_deep_dive_score", 0.0)),
-            float(x.get("cybermed_score", 0.0)),
-        ),
+        (pooled[id(cand)] for cand in overview_items),
+        key=attrgetter("deep_sort_key"),
         reverse=True,
     )
 
     domain_counts: Dict[str, int] = {}
-    for cand in deep_candidates:
+    for pooled_cand in deep_candidates:
+        cand = pooled_cand.item
         if len(deep_dive_items) >= max_deep_dives:
             break
 
         if cand.get("cybermed_deep_dive_hard_excluded"):
             continue
         ev_label = str(cand.get("evidence_strength_label") or "").upper()
-        has_real_evidence_pubtype = _has_real_evidence_pubtype(_pub_types(cand))
-        title_floor_blocked = bool(_title_correspondence_or_commentary_reasons(str(cand.get("title") or ""))) and not has_real_evidence_pubtype
-        if cand.get("low_evidence_radar") or ev_label not in {"A", "B", "C"} or _is_correction_or_commentary_item(str(cand.get("title") or ""), _pub_types(cand))[0] or title_floor_blocked or str(cand.get("floor_rejection_reason") or "").strip() or not bool(cand.get("has_usable_content")):
+        if cand.get("low_evidence_radar") or ev_label not in {"A", "B", "C"} or pooled_cand.is_correction_or_commentary or pooled_cand.title_floor_blocked or str(cand.get("floor_rejection_reason") or "").strip() or not bool(cand.get("has_usable_content")):
             deep_dive_floor_rejection_counts["low_evidence_news_or_commentary"] += 1
             continue
 
@@ -997,7 +1351,8 @@ def select_cybermed_pubmed_items(
         cand["deep_dive_reasons"] = compact
         for r in compact: deep_dive_reason_counts_v1[r]+=1
         for r in cand.get("cybermed_deep_dive_reasons", []):
-            reason_counter[str(r)] += 1
+            r = str(r)
+            reason_counter[r] = reason_counter.get(r, 0) + 1
 
     deep_dive_candidates = [
         str(
@@ -1009,7 +1364,7 @@ def select_cybermed_pubmed_items(
             or cand.get("title")
             or idx
         )
-        for idx, cand in enumerate(deep_candidates, start=1)
+        for idx, cand in enumerate((pooled_cand.item for pooled_cand in deep_candidates), start=1)
     ][:max_deep_dives]
 
     # Non-sensitive stats only (no titles, no URLs, no recipients).
@@ -1040,8 +1395,9 @@ def select_cybermed_pubmed_items(
         "max_deep_dives": max_deep_dives,
         "max_selected_per_run": max_overview,
         "max_selected": max_overview,
-        "top_scores": [round(float(it.get("cybermed_score", 0.0)), 2) for it in overview_sorted[: min(5, len(overview_sorted))]],
-        "deep_dive_reason_counts": dict(reason_counter.most_common(8)),
+        "top_scores": [round(-overview_sort_keys[i][1], 2) for i in overview_order[:5]],
+        # Same order as Counter.most_common(8): stable sort by count, descending.
+        "deep_dive_reason_counts": dict(sorted(reason_counter.items(), key=itemgetter(1), reverse=True)[:8]),
         "selection_diagnostics": {
             "excluded_overview_offtopic": excluded_overview_offtopic,
             "below_threshold_overview": below_threshold_overview,
@@ -1222,6 +1578,27 @@ def _title_correspondence_or_commentary_reasons(title: str) -> List[str]:
     return reasons
 
 
+# Vocabularies for the FOAMed labels below, scanned together in one pass per item.
+_FOAMED_LABEL_EVIDENCE_KW = _keyword_set(["randomized trial","randomized controlled trial","rct","systematic review","meta-analysis","meta analysis","guideline","consensus","cohort","diagnostic accuracy"])
+_FOAMED_LABEL_PRACTICE_UPDATE_KW = _keyword_set(["practice update","management update","clinical update"])
+_FOAMED_LABEL_CLINICAL_REVIEW_KW = _keyword_set(["clinical review","evidence appraisal","case-based educational review","case based educational review"])
+_FOAMED_LABEL_EDUCATION_KW = _keyword_set(["high-yield","high yield","teaching","educational","bedside pearl"])
+_FOAMED_LABEL_LOW_VALUE_KW = _keyword_set(["historical","history of","personal reflection","reflection","podcast","general commentary","opinion"])
+_FOAMED_LABEL_NO_NEW_DATA_KW = _keyword_set(["no new data","general reflection"])
+_FOAMED_LABEL_DIRECT_CLINICAL_KW = _keyword_set(["icu","critical care","emergency","anesthesia","anaesthesia","airway","sepsis","shock","ventilation"])
+_FOAMED_LABEL_SCANNER = _KeywordScanner(
+    [
+        _FOAMED_LABEL_EVIDENCE_KW,
+        _FOAMED_LABEL_PRACTICE_UPDATE_KW,
+        _FOAMED_LABEL_CLINICAL_REVIEW_KW,
+        _FOAMED_LABEL_EDUCATION_KW,
+        _FOAMED_LABEL_LOW_VALUE_KW,
+        _FOAMED_LABEL_NO_NEW_DATA_KW,
+        _FOAMED_LABEL_DIRECT_CLINICAL_KW,
+    ]
+)
+
+
 def _attach_evidence_hint_labels(item: Dict[str, Any], *, foamed: bool=False) -> None:
     """Attach display-ready heuristic labels (not official GRADE).
 
@@ -1255,13 +1632,14 @@ def _attach_evidence_hint_labels(item: Dict[str, Any], *, foamed: bool=False) ->
             conf = "low"
         item["text_confidence_label"] = conf
 
-        evidence = any(k in hay for k in ["randomized trial","randomized controlled trial","rct","systematic review","meta-analysis","meta analysis","guideline","consensus","cohort","diagnostic accuracy"])
-        practice_update = any(k in hay for k in ["practice update","management update","clinical update"])
-        clinical_review = any(k in hay for k in ["clinical review","evidence appraisal","case-based educational review","case based educational review"])
-        education = any(k in hay for k in ["high-yield","high yield","teaching","educational","bedside pearl"]) 
-        low_value = any(k in hay for k in ["historical","history of","personal reflection","reflection","podcast","general commentary","opinion"]) 
-        nonclinical_commentary = low_value or any(k in hay for k in ["no new data","general reflection"])
-        direct_clinical = any(k in hay for k in ["icu","critical care","emergency","anesthesia","anaesthesia","airway","sepsis","shock","ventilation"])
+        hits = _FOAMED_LABEL_SCANNER.scan(hay)
+        evidence = hits.hit(_FOAMED_LABEL_EVIDENCE_KW)
+        practice_update = hits.hit(_FOAMED_LABEL_PRACTICE_UPDATE_KW)
+        clinical_review = hits.hit(_FOAMED_LABEL_CLINICAL_REVIEW_KW)
+        education = hits.hit(_FOAMED_LABEL_EDUCATION_KW)
+        low_value = hits.hit(_FOAMED_LABEL_LOW_VALUE_KW)
+        nonclinical_commentary = low_value or hits.hit(_FOAMED_LABEL_NO_NEW_DATA_KW)
+        direct_clinical = hits.hit(_FOAMED_LABEL_DIRECT_CLINICAL_KW)
 
         usefulness = 1
         relevance = 1
@@ -1327,6 +1705,31 @@ def _attach_evidence_hint_labels(item: Dict[str, Any], *, foamed: bool=False) ->
     item['practice_change_potential_1_5']=max(1,min(5,impact))
     item['text_confidence_label']='high' if str(item.get('content_length_bucket')) in {'long','very_long'} else ('moderate' if str(item.get('content_length_bucket')) in {'medium','short'} else 'low')
     item['evidence_label_reason']=f"article-level heuristic: {basis}"
+
+
+# FOAMed domain vocabularies, normalized once at import.
+_FOAMED_ANESTHESIA_KW = _keyword_set(["anesthesia", "anaesthesia", "anesthesiology", "perioperative", "operating room", "or theater", "neuraxial", "epidural", "spinal", "block", "regional anesthesia"])
+_FOAMED_ICU_KW = _keyword_set(["icu", "intensive care", "critical care", "ventilator", "mechanical ventilation", "ards", "ecmo", "hemodynamic", "haemodynamic", "vasopressor", "norepinephrine", "sedation", "delirium", "crrt"])
+_FOAMED_EMERGENCY_KW = _keyword_set(["resuscitation", "cardiac arrest", "prehospital", "ems", "emergency department", "ed"])
+_FOAMED_AIRWAY_KW = _keyword_set(["airway", "intubation", "extubation", "ventilation", "respiratory", "oxygenation"])
+_FOAMED_INFECTION_KW = _keyword_set(["sepsis", "infection", "antibiotic", "antimicrobial", "pneumonia"])
+_FOAMED_HEMODYNAMICS_KW = _keyword_set(["shock", "blood pressure", "circulation", "hemodynamic", "haemodynamic", "vasopressor", "inotrope"])
+_FOAMED_PAIN_KW = _keyword_set(["pain", "analgesia", "opioid", "opioids", "nerve block", "regional block", "fascial plane"])
+_FOAMED_PAIN_CONTEXT_KW = _keyword_set(["ultrasound-guided", "catheter", "perioperative", "postoperative", "perineural"])
+_FOAMED_SCANNER = _KeywordScanner(
+    [
+        _FOAMED_ANESTHESIA_KW,
+        _FOAMED_ICU_KW,
+        _FOAMED_EMERGENCY_KW,
+        _FOAMED_AIRWAY_KW,
+        _FOAMED_INFECTION_KW,
+        _FOAMED_HEMODYNAMICS_KW,
+        _FOAMED_PAIN_KW,
+        _FOAMED_PAIN_CONTEXT_KW,
+    ]
+)
+
+
 def _foamed_domain_score(hay: str) -> Tuple[float, Dict[str, bool], bool]:
     """
     Lightweight clinical relevance signals for FOAMed/blog posts.
@@ -1334,105 +1737,19 @@ def _foamed_domain_score(hay: str) -> Tuple[float, Dict[str, bool], bool]:
     Returns (score, flags, pain_blocked_for_context).
     """
 
+    hits = _FOAMED_SCANNER.scan(hay)
     flags = {
-        "anesthesia_periop": _contains_any_keyword(
-            hay,
-            [
-                "anesthesia",
-                "anaesthesia",
-                "anesthesiology",
-                "perioperative",
-                "operating room",
-                "or theater",
-                "neuraxial",
-                "epidural",
-                "spinal",
-                "block",
-                "regional anesthesia",
-            ],
-        ),
-        "icu_ccm": _contains_any_keyword(
-            hay,
-            [
-                "icu",
-                "intensive care",
-                "critical care",
-                "ventilator",
-                "mechanical ventilation",
-                "ards",
-                "ecmo",
-                "hemodynamic",
-                "haemodynamic",
-                "vasopressor",
-                "norepinephrine",
-                "sedation",
-                "delirium",
-                "crrt",
-            ],
-        ),
-        "emergency_resus": _contains_any_keyword(
-            hay,
-            [
-                "resuscitation",
-                "cardiac arrest",
-                "prehospital",
-                "ems",
-                "emergency department",
-                "ed",
-            ],
-        ),
-        "airway_resp": _contains_any_keyword(
-            hay,
-            [
-                "airway",
-                "intubation",
-                "extubation",
-                "ventilation",
-                "respiratory",
-                "oxygenation",
-            ],
-        ),
-        "infection_sepsis": _contains_any_keyword(
-            hay,
-            [
-                "sepsis",
-                "infection",
-                "antibiotic",
-                "antimicrobial",
-                "pneumonia",
-            ],
-        ),
-        "hemodynamics": _contains_any_keyword(
-            hay,
-            [
-                "shock",
-                "blood pressure",
-                "circulation",
-                "hemodynamic",
-                "haemodynamic",
-                "vasopressor",
-                "inotrope",
-            ],
-        ),
+        "anesthesia_periop": hits.hit(_FOAMED_ANESTHESIA_KW),
+        "icu_ccm": hits.hit(_FOAMED_ICU_KW),
+        "emergency_resus": hits.hit(_FOAMED_EMERGENCY_KW),
+        "airway_resp": hits.hit(_FOAMED_AIRWAY_KW),
+        "infection_sepsis": hits.hit(_FOAMED_INFECTION_KW),
+        "hemodynamics": hits.hit(_FOAMED_HEMODYNAMICS_KW),
     }
 
-    pain_hit = _contains_any_keyword(
-        hay,
-        [
-            "pain",
-            "analgesia",
-            "opioid",
-            "opioids",
-            "nerve block",
-            "regional block",
-            "fascial plane",
-        ],
-    )
+    pain_hit = hits.hit(_FOAMED_PAIN_KW)
     pain_context = flags["anesthesia_periop"] or flags["icu_ccm"] or flags["emergency_resus"] or flags["airway_resp"] or flags["hemodynamics"]
-    pain_context = pain_context or _contains_any_keyword(
-        hay,
-        ["ultrasound-guided", "catheter", "perioperative", "postoperative", "perineural"],
-    )
+    pain_context = pain_context or hits.hit(_FOAMED_PAIN_CONTEXT_KW)
 
     pain_blocked = False
     if pain_hit and pain_context:
@@ -1447,48 +1764,84 @@ def _foamed_domain_score(hay: str) -> Tuple[float, Dict[str, bool], bool]:
     return float(score), flags, pain_blocked
 
 
+# Curated source names keyed by path and validated against (mtime_ns, size), like _CONFIG_CACHE.
+_CURATED_FOAMED_SOURCES_CACHE: Dict[str, Tuple[Tuple[int, int], frozenset]] = {}
+
+
 def _load_curated_foamed_sources(path: str = "data/cybermed_foamed_sources.json") -> set[str]:
     try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CURATED_FOAMED_SOURCES_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return set(cached[1])
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         if not isinstance(data, list):
             return set()
         names = [str(entry.get("name") or "") for entry in data if isinstance(entry, dict)]
-        return {n.strip().lower() for n in names if n.strip()}
+        sources = frozenset(n.strip().lower() for n in names if n.strip())
+        _CURATED_FOAMED_SOURCES_CACHE[path] = (stamp, sources)
+        return set(sources)
     except Exception:
         return set()
 
 
+_FOAMED_KEY_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+# Overview and top-pick vocabularies of select_cybermed_foamed_items, scanned in one pass per item.
+_FOAMED_NONCLINICAL_KW = _keyword_set(["historical","personal reflection","general commentary","podcast"])
+_FOAMED_EVIDENCE_SUMMARY_KW = _keyword_set(["randomized","systematic review","meta-analysis","guideline","consensus"])
+_FOAMED_CLINICAL_REVIEW_KW = _keyword_set(["clinical review","evidence appraisal"])
+_FOAMED_PRACTICE_UPDATE_KW = _keyword_set(["practice update","clinical update"])
+_FOAMED_ACTIONABLE_COMMENTARY_KW = _keyword_set(["commentary","editorial","practice change","bedside implication"])
+_FOAMED_TOP_PICK_NONCLINICAL_KW = _keyword_set(["historical","personal reflection","general commentary","no new data"])
+_FOAMED_SELECTION_SCANNER = _KeywordScanner(
+    [
+        _FOAMED_NONCLINICAL_KW,
+        _FOAMED_EVIDENCE_SUMMARY_KW,
+        _FOAMED_CLINICAL_REVIEW_KW,
+        _FOAMED_PRACTICE_UPDATE_KW,
+        _FOAMED_ACTIONABLE_COMMENTARY_KW,
+        _FOAMED_TOP_PICK_NONCLINICAL_KW,
+    ]
+)
+
+
+def _norm_foamed_key(t: str) -> str:
+    # Lowercase alphanumeric words joined by single spaces (dedupe keys for titles, URLs, text).
+    return _FOAMED_KEY_SEPARATOR_RE.sub(" ", (t or "").lower()).strip()
+
+
 def select_cybermed_foamed_items(
     foamed_items: List[Dict[str, Any]],
     *,
     max_overview: int = 40,
     max_top_picks: int = 2,
 ) -> FoamedSelection:
-    now = datetime.now(timezone.utc)
     selected_reason_counts: Counter[str] = Counter()
     excluded_reason_counts: Counter[str] = Counter()
     top_pick_rejection_counts: Counter[str] = Counter()
     dup_reason_counts: Counter[str] = Counter()
     dup_total = 0
     enriched: List[Dict[str, Any]] = []
+    # Haystack and keyword hits per row (by id; rows live in ``enriched``), reused by later passes.
+    hay_by_row: Dict[int, str] = {}
+    hits_by_row: Dict[int, _TextHits] = {}
     for it in foamed_items:
+        # Shallow copy on purpose: labels are attached in place below, and main.py falls back to the
+        # untouched input items if selection fails.
         row = dict(it)
         _attach_evidence_hint_labels(row, foamed=True)
         row["reason_labels"] = list(row.get("reason_labels") or [])
-        hay = _text_haystack(row)
+        hay = hay_by_row[id(row)] = _text_haystack(row)
         score, flags, _ = _foamed_domain_score(hay)
         row["foamed_flags"] = flags
         row["foamed_score"] = float(score)
         enriched.append(row)
 
-    def _norm_title(t: str) -> str:
-        return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]+", " ", (t or "").lower())).strip()
-    def _norm_text(t: str) -> str:
-        return re.sub(r"\s+", " ", re.sub(r"[^a-z0-9 ]+", " ", (t or "").lower())).strip()
     def _content_fingerprint(it: Dict[str, Any]) -> str:
         seed = str(it.get("bottom_line") or it.get("text") or "")[:500]
-        return _norm_text(seed)
+        return _norm_foamed_key(seed)
     def _url_score(u: str) -> int:
         u=(u or "").lower()
         if any(x in u for x in ["/category/","/tag/","/index","/page/"]):
@@ -1501,9 +1854,9 @@ def select_cybermed_foamed_items(
     grouped: Dict[tuple, Dict[str, Any]] = {}
     for it in enriched:
         src = str(it.get("foamed_source") or it.get("channel") or "").lower()
-        title_key = _norm_title(str(it.get("title") or ""))[:120]
-        canon_key = _norm_text(str(it.get("canonical_url") or it.get("url") or ""))
-        pmid = _norm_text(str(it.get("pmid") or ""))
+        title_key = _norm_foamed_key(str(it.get("title") or ""))[:120]
+        canon_key = _norm_foamed_key(str(it.get("canonical_url") or it.get("url") or ""))
+        pmid = _norm_foamed_key(str(it.get("pmid") or ""))
         fp = _content_fingerprint(it)
         keys = [("title", src, title_key), ("canon", src, canon_key), ("fp", src, fp)]
         if pmid:
@@ -1539,13 +1892,14 @@ def select_cybermed_foamed_items(
         dup_reason_counts[prior_reason or "duplicate_same_normalized_title"] += 1
 
     overview_candidates=[]
+    overview_sort_keys: List[Tuple[float, int, int]] = []
     unique_grouped = list({id(v): v for v in grouped.values()}.values())
     for it in unique_grouped:
         usefulness=int(it.get("clinical_usefulness_1_5") or 1)
         relevance=int(it.get("practice_relevance_1_5") or 1)
         conf=str(it.get("text_confidence_label") or "low")
-        hay=_text_haystack(it)
-        nonclinical=any(k in hay for k in ["historical","personal reflection","general commentary","podcast"]) 
+        hits=hits_by_row[id(it)]=_FOAMED_SELECTION_SCANNER.scan(hay_by_row[id(it)])
+        nonclinical=hits.hit(_FOAMED_NONCLINICAL_KW)
         if nonclinical:
             excluded_reason_counts["foamed_excluded_nonclinical_commentary"] += 1
             continue
@@ -1565,38 +1919,43 @@ def select_cybermed_foamed_items(
         if str(it.get("source_quality_label")) == "optional" and (usefulness < 3 or relevance < 3):
             excluded_reason_counts["foamed_excluded_optional_low_value"] += 1
             continue
-        if any(k in hay for k in ["randomized","systematic review","meta-analysis","guideline","consensus"]):
+        if hits.hit(_FOAMED_EVIDENCE_SUMMARY_KW):
             it["reason_labels"].append("foamed_selected_evidence_summary")
             selected_reason_counts["foamed_selected_evidence_summary"] += 1
-        elif any(k in hay for k in ["clinical review","evidence appraisal"]):
+        elif hits.hit(_FOAMED_CLINICAL_REVIEW_KW):
             it["reason_labels"].append("foamed_selected_clinical_review")
             selected_reason_counts["foamed_selected_clinical_review"] += 1
-        elif any(k in hay for k in ["practice update","clinical update"]):
+        elif hits.hit(_FOAMED_PRACTICE_UPDATE_KW):
             it["reason_labels"].append("foamed_selected_practice_update")
             selected_reason_counts["foamed_selected_practice_update"] += 1
-        elif any(k in hay for k in ["commentary","editorial","practice change","bedside implication"]):
+        elif hits.hit(_FOAMED_ACTIONABLE_COMMENTARY_KW):
             it["reason_labels"].append("foamed_selected_clinically_actionable_commentary")
             selected_reason_counts["foamed_selected_clinically_actionable_commentary"] += 1
         else:
             it["reason_labels"].append("foamed_selected_high_yield_education")
             selected_reason_counts["foamed_selected_high_yield_education"] += 1
         overview_candidates.append(it)
+        overview_sort_keys.append((-it["foamed_score"], -usefulness, -relevance))
 
-    overview_candidates.sort(key=lambda x: (-float(x.get("foamed_score",0.0)), -int(x.get("clinical_usefulness_1_5") or 1), -int(x.get("practice_relevance_1_5") or 1)))
-    overview_items = overview_candidates[:max_overview]
+    # Keys captured at append time; sorting indices keeps the stable order of the old key sort.
+    # Only the first max_overview survive, so large pools take a stable top-K instead.
+    if 0 < max_overview and len(overview_candidates) >= _HEAP_SELECT_MIN_RATIO * max_overview:
+        overview_order = heapq.nsmallest(max_overview, range(len(overview_candidates)), key=overview_sort_keys.__getitem__)
+    else:
+        overview_order = sorted(range(len(overview_candidates)), key=overview_sort_keys.__getitem__)[:max_overview]
+    overview_items = [overview_candidates[i] for i in overview_order]
     top_picks=[]
     for it in overview_items:
         it["top_pick"]=False
         use=int(it.get("clinical_usefulness_1_5") or 1); rel=int(it.get("practice_relevance_1_5") or 1); conf=str(it.get("text_confidence_label") or "low")
         sq=str(it.get("source_quality_label") or "optional")
-        hay=_text_haystack(it)
         if sq not in {"core","important"}: top_pick_rejection_counts["foamed_top_pick_floor_rejected_optional_source"] += 1; continue
         if use <3: top_pick_rejection_counts["foamed_top_pick_floor_rejected_low_usefulness"] += 1; continue
         if rel <3: top_pick_rejection_counts["foamed_top_pick_floor_rejected_low_relevance"] += 1; continue
         if conf not in {"high","moderate"}: top_pick_rejection_counts["foamed_top_pick_floor_rejected_low_confidence"] += 1; continue
         if str(it.get("final_content_source") or "") not in {"article_full_text","article_excerpt","rss_full_content","html_content"} or int(it.get("article_text_length") or it.get("text_length") or 0) < 180:
             top_pick_rejection_counts["foamed_top_pick_floor_rejected_weak_content"] += 1; continue
-        if any(k in hay for k in ["historical","personal reflection","general commentary","no new data"]):
+        if hits_by_row[id(it)].hit(_FOAMED_TOP_PICK_NONCLINICAL_KW):
             top_pick_rejection_counts["foamed_top_pick_floor_rejected_nonclinical_commentary"] += 1; continue
         if len(top_picks) < max_top_picks:
             it["top_pick"]=True
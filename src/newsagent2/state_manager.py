@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-import json
+import heapq
 import os
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
+from .utils.json_compat import (
+    dump_state_bytes,
+    parse_state_bytes,
+    remember_state_file,
+    state_content_digest,
+    state_file_layout,
+    state_file_unchanged,
+)
+
 
 # Delimiter for compound keys (report_key || source || item_id)
 _ITEM_KEY_DELIM = "||"
@@ -22,6 +32,11 @@ def _new_state() -> Dict[str, Any]:
     }
 
 
+def _state_compact_enabled() -> bool:
+    # Opt-in: the committed state files stay pretty-printed (and diffable) unless a run asks otherwise.
+    return (os.getenv("NEWSAGENT_STATE_COMPACT", "0") or "0").strip() != "0"
+
+
 def load_state(path: str) -> Dict[str, Any]:
     """Load JSON state from disk (defensive)."""
     if not path:
@@ -33,22 +48,28 @@ def load_state(path: str) -> Dict[str, Any]:
         return _new_state()
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = f.read().strip()
-        if not raw:
+        # Both parsers accept UTF-8 bytes directly, so skip the separate decode + strip copies.
+        with open(path, "rb") as f:
+            raw = f.read()
+            st = os.fstat(f.fileno())
+        if not raw or raw.isspace():
             print(f"[state] WARN: state file {path!r} is empty -> starting fresh")
             return _new_state()
 
-        data = json.loads(raw)
+        data = parse_state_bytes(raw)
         if not isinstance(data, dict):
             print(f"[state] WARN: invalid JSON root type in {path!r} -> starting fresh")
             return _new_state()
 
+        complete = "version" in data and "updated_at_utc" in data and isinstance(data.get("reports"), dict)
         data.setdefault("version", 1)
         data.setdefault("updated_at_utc", _utc_now_iso())
         data.setdefault("reports", {})
         if not isinstance(data.get("reports"), dict):
             data["reports"] = {}
+        if complete:
+            # The file already holds exactly this content, so an unchanged save can be skipped.
+            remember_state_file(path, state_content_digest(data), state_file_layout(raw), st)
 
         return data
     except Exception as e:
@@ -83,14 +104,20 @@ def save_state(path: str, state: Dict[str, Any]) -> None:
         print(f"[state] ERROR: cannot create state directory for {path!r}: {e!r}")
         raise
 
+    digest = state_content_digest(state)
+    compact = _state_compact_enabled()
+    if state_file_unchanged(path, digest, compact):
+        print(f"[state] State unchanged since last save -> skipping write to {path!r}")
+        return
+
     try:
         state["updated_at_utc"] = _utc_now_iso()
-        payload = json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True)
+        payload = dump_state_bytes(state, compact=compact)
         tmp_path = f"{path}.tmp"
-        with open(tmp_path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "wb") as f:
             f.write(payload)
-            f.write("\n")
         os.replace(tmp_path, path)
+        remember_state_file(path, digest, compact)
         print(f"[state] Saved state to {path!r}")
     except Exception as e:
         print(f"[state] ERROR: failed to save state to {path!r}: {e!r}")
@@ -103,6 +130,14 @@ def save_state(path: str, state: Dict[str, Any]) -> None:
 
 
 def _ensure_bucket(state: Dict[str, Any], report_key: str, source: str) -> Dict[str, Any]:
+    # Fast path for the usual, already well-formed bucket; anything else is created or repaired below.
+    try:
+        processed = state["reports"][report_key][source]["processed"]
+    except (KeyError, TypeError):
+        processed = None
+    if isinstance(processed, dict):
+        return processed
+
     reports = state.setdefault("reports", {})
     if not isinstance(reports, dict):
         state["reports"] = {}
@@ -133,16 +168,23 @@ def _sanitize_key_part(value: str) -> str:
     return value
 
 
-def _parse_iso_utc(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
+# Timestamps are second-resolution strings stamped once per run, so a large state holds only a
+# handful of distinct values; parse each once (datetimes are immutable, so sharing is safe).
+@lru_cache(maxsize=4096)
+def _parse_iso_utc_text(text: str) -> Optional[datetime]:
     try:
-        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
         return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
     except Exception:
         return None
 
 
+def _parse_iso_utc(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return _parse_iso_utc_text(str(value))
+
+
 def make_item_key(
     report_key: str,
     source: str,
@@ -355,6 +397,12 @@ def should_skip_pubmed_item(
     return False, "no_meta"
 
 
+def _processed_at_sort_key(entry: Tuple[str, Any]) -> str:
+    meta = entry[1]
+    ts = meta.get("processed_at_utc") if isinstance(meta, dict) else None
+    return str(ts or "")
+
+
 def prune_state(
     state: Dict[str, Any],
     retention_days: int = 120,
@@ -377,6 +425,8 @@ def prune_state(
         return state
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=max(retention_days, 0))
+    # Age verdict per distinct processed_at_utc string, shared by every bucket.
+    expired_by_ts: Dict[str, bool] = {}
 
     reports = state.get("reports")
     if not isinstance(reports, dict):
@@ -392,36 +442,35 @@ def prune_state(
             if not isinstance(processed, dict):
                 continue
 
-            # Age-based pruning
+            # Age-based pruning. Only the stale keys are collected and deleted: most runs drop few or no
+            # entries, and rebuilding the bucket would re-insert every surviving entry each time.
             if retention_days > 0:
-                for iid, meta in list(processed.items()):
+                stale = []
+                for iid, meta in processed.items():
                     if not isinstance(meta, dict):
                         continue
                     ts = meta.get("processed_at_utc")
                     if not isinstance(ts, str) or not ts:
                         continue
-                    try:
-                        dt_obj = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                        if dt_obj.tzinfo is None:
-                            dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-                    except Exception:
-                        continue
-                    if dt_obj < cutoff:
-                        processed.pop(iid, None)
-                        removed_age += 1
+                    expired = expired_by_ts.get(ts)
+                    if expired is None:
+                        dt_obj = _parse_iso_utc_text(ts)
+                        expired = expired_by_ts[ts] = dt_obj is not None and dt_obj < cutoff
+                    if expired:
+                        stale.append(iid)
+                for iid in stale:
+                    del processed[iid]
+                removed_age += len(stale)
 
             # Hard cap per bucket
             if max_entries_per_bucket and max_entries_per_bucket > 0:
                 if len(processed) > max_entries_per_bucket:
-                    sortable = []
-                    for iid, meta in processed.items():
-                        ts = meta.get("processed_at_utc") if isinstance(meta, dict) else None
-                        sortable.append((str(ts or ""), iid))
-                    sortable.sort(key=lambda t: t[0])  # oldest first
                     to_remove = len(processed) - max_entries_per_bucket
-                    for _, iid in sortable[:to_remove]:
-                        processed.pop(iid, None)
-                        removed_cap += 1
+                    # Partial selection of the oldest entries; same stable order as a full sort.
+                    oldest = heapq.nsmallest(to_remove, processed.items(), key=_processed_at_sort_key)
+                    for iid, _ in oldest:
+                        del processed[iid]
+                    removed_cap += len(oldest)
 
     if removed_age or removed_cap:
         print(f"[state] Pruned state: removed_by_age={removed_age}, removed_by_cap={removed_cap}")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from typing import Any, Dict, Optional, Tuple
+
+try:  # Optional accelerator; only used where orjson_matches_stdlib() proves the output identical.
+    import orjson
+except Exception:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+# Python's float repr switches to exponent form outside [1e-4, 1e16) ("1e-05", "1e+16"); orjson
+# formats that range differently ("0.00001") and writes NaN/Infinity as null.
+_FLOAT_PLAIN_MIN = 1e-4
+_FLOAT_PLAIN_MAX = 1e16
+
+
+def orjson_matches_stdlib(value: Any) -> bool:
+    """True if orjson encodes value to the same JSON text as json.dumps(ensure_ascii=False)."""
+    stack = [value]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        v = pop()
+        t = type(v)
+        if t is str or t is int or t is bool or v is None:
+            continue
+        if t is float:
+            if v != 0.0 and not (math.isfinite(v) and _FLOAT_PLAIN_MIN <= abs(v) < _FLOAT_PLAIN_MAX):
+                return False
+        elif t is dict:
+            for k, item in v.items():
+                if type(k) is not str:
+                    return False
+                push(item)
+        elif t is list or t is tuple:
+            stack.extend(v)
+        else:
+            # datetime, Enum, dataclasses, subclasses, ...: orjson encodes some that stdlib rejects.
+            return False
+    return True
+
+
+def parse_state_bytes(raw: bytes) -> Any:
+    """Parse a UTF-8 JSON state file body; accepts everything json.loads accepts."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity, >64-bit ints or a BOM: let the stdlib parser accept or reject it
+    return json.loads(raw)
+
+
+def orjson_dump_state_bytes(state: Dict[str, Any], compact: bool = False) -> Optional[bytes]:
+    """orjson encoding of dump_state_bytes(state, compact), or None where only stdlib can produce it."""
+    if orjson is None or not orjson_matches_stdlib(state):
+        return None  # e.g. NaN/Infinity, exponent-form floats or datetimes
+    try:
+        if compact:
+            return orjson.dumps(state) + b"\n"
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    except TypeError:
+        return None  # e.g. ints beyond 64 bits: leave those to the stdlib encoder
+
+
+def dump_state_bytes(state: Dict[str, Any], compact: bool = False) -> bytes:
+    """State file body: indent=2 + sorted keys by default, or compact in insertion order."""
+    payload = orjson_dump_state_bytes(state, compact)
+    if payload is not None:
+        return payload
+    if compact:
+        return (json.dumps(state, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    return (json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def state_content_digest(state: Dict[str, Any]) -> bytes:
+    """sha256 of a compact, key-sorted encoding of everything except the save timestamp."""
+    body = {k: v for k, v in state.items() if k != "updated_at_utc"}
+    encoded = None
+    if orjson is not None and orjson_matches_stdlib(body):
+        try:
+            encoded = orjson.dumps(body, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            encoded = None
+    if encoded is None:
+        encoded = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).digest()
+
+
+# abspath -> (content digest, compact layout or None if unknown, st_mtime_ns, st_size) of each state
+# file as this process last loaded or wrote it; lets savers skip rewriting a file whose content and
+# layout would not change.
+_LAST_SAVED_STATE: Dict[str, Tuple[bytes, Optional[bool], int, int]] = {}
+
+
+def state_file_layout(raw: bytes) -> Optional[bool]:
+    """True/False for files in the compact/pretty dump_state_bytes layout; None for anything else."""
+    if raw.startswith(b'{"'):
+        return True
+    if raw.startswith(b'{\n  "'):
+        return False
+    return None
+
+
+def remember_state_file(path: str, digest: bytes, compact: Optional[bool], st: Optional[os.stat_result] = None) -> None:
+    """Record that path now holds content with this digest in this layout (st defaults to os.stat)."""
+    if st is None:
+        st = os.stat(path)
+    _LAST_SAVED_STATE[os.path.abspath(path)] = (digest, compact, st.st_mtime_ns, st.st_size)
+
+
+def state_file_unchanged(path: str, digest: bytes, compact: bool) -> bool:
+    """True if path still holds exactly what remember_state_file last recorded for digest and layout."""
+    last_saved = _LAST_SAVED_STATE.get(os.path.abspath(path))
+    # A layout switch must rewrite the file even when its content is unchanged.
+    if last_saved is None or last_saved[:2] != (digest, compact):
+        return False
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == last_saved[2:]
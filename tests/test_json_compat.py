@@ -0,0 +1,99 @@
+import json
+import pathlib
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from newsagent2.utils import json_compat
+
+
+_STATE = {
+    "version": 1,
+    "reports": {"cybermed": {"pubmed": {"processed": {"2": {"title": "Übersicht — ok", "tags": [], "extra": {}}}}}},
+}
+_EXTRAS = (
+    {},
+    {"n": 3, "flag": True, "none": None, "ratio": 0.1, "neg": -5.5, "big": 2**63, "pair": (1, "a")},
+    {"small": 1e-05, "huge": 1e16, "tiny": -2.5e-07},
+    {"nan": float("nan"), "inf": float("-inf")},
+)
+
+
+def test_orjson_matches_stdlib_rejects_values_orjson_encodes_differently():
+    assert json_compat.orjson_matches_stdlib(_STATE)
+    assert json_compat.orjson_matches_stdlib({"a": [0.0, -0.0, 0.0001, 9999999999999998.0, "x", None]})
+    for bad in (1e-05, 1e16, float("nan"), float("inf"), datetime(2026, 1, 1, tzinfo=timezone.utc), {1: "a"}):
+        assert not json_compat.orjson_matches_stdlib({"a": [bad]})
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_dump_state_bytes_orjson_output_matches_stdlib(monkeypatch, compact):
+    orjson_mod = pytest.importorskip("orjson")
+    for extra in _EXTRAS:
+        state = dict(_STATE, **extra)
+        monkeypatch.setattr(json_compat, "orjson", orjson_mod)
+        fast = json_compat.dump_state_bytes(state, compact)
+        monkeypatch.setattr(json_compat, "orjson", None)
+        assert fast == json_compat.dump_state_bytes(state, compact)
+
+    assert b"NaN" in fast and b"-Infinity" in fast
+    if not compact:
+        assert fast.startswith(b'{\n  "')
+
+
+def test_dump_state_bytes_rejects_datetimes():
+    with pytest.raises(TypeError):
+        json_compat.dump_state_bytes({"when": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+
+
+def test_state_content_digest_matches_stdlib_and_ignores_timestamp(monkeypatch):
+    orjson_mod = pytest.importorskip("orjson")
+    for extra in _EXTRAS:
+        state = dict(_STATE, **extra)
+        monkeypatch.setattr(json_compat, "orjson", orjson_mod)
+        fast = json_compat.state_content_digest(state)
+        monkeypatch.setattr(json_compat, "orjson", None)
+        assert fast == json_compat.state_content_digest(state)
+
+    monkeypatch.setattr(json_compat, "orjson", orjson_mod)
+    stamped = dict(_STATE, updated_at_utc="2026-01-01T00:00:00+00:00")
+    assert json_compat.state_content_digest(stamped) == json_compat.state_content_digest(_STATE)
+    # NaN must not digest like null, or a None -> NaN change would be skipped as "unchanged".
+    assert json_compat.state_content_digest({"score": None}) != json_compat.state_content_digest({"score": float("nan")})
+
+
+def test_parse_state_bytes_accepts_stdlib_only_json():
+    data = json_compat.parse_state_bytes(b'\xef\xbb\xbf{"score": NaN, "big": 123456789012345678901234567890}')
+    assert data["big"] == 123456789012345678901234567890
+    assert data["score"] != data["score"]
+    assert json_compat.parse_state_bytes(json.dumps(_STATE).encode("utf-8")) == _STATE
+
+
+def test_state_file_unchanged_tracks_digest_layout_and_file_stamp(tmp_path):
+    path = tmp_path / "state.json"
+    pretty = json_compat.dump_state_bytes(_STATE)
+    path.write_bytes(pretty)
+    digest = json_compat.state_content_digest(_STATE)
+    assert json_compat.state_file_layout(pretty) is False
+    assert json_compat.state_file_layout(json_compat.dump_state_bytes(_STATE, compact=True)) is True
+    assert json_compat.state_file_layout(b'{ "version": 1}') is None
+
+    assert not json_compat.state_file_unchanged(str(path), digest, False)
+    json_compat.remember_state_file(str(path), digest, json_compat.state_file_layout(pretty))
+    assert json_compat.state_file_unchanged(str(path), digest, False)
+    assert not json_compat.state_file_unchanged(str(path), digest, True)
+    assert not json_compat.state_file_unchanged(str(path), json_compat.state_content_digest({}), False)
+
+    path.write_bytes(pretty + b"\n")
+    assert not json_compat.state_file_unchanged(str(path), digest, False)
+    path.unlink()
+    assert not json_compat.state_file_unchanged(str(path), digest, False)
+
+    # Hand-edited files (unknown layout) are always rewritten.
+    path.write_bytes(b'{ "version": 1}')
+    json_compat.remember_state_file(str(path), digest, json_compat.state_file_layout(path.read_bytes()))
+    assert not json_compat.state_file_unchanged(str(path), digest, False)
+    assert not json_compat.state_file_unchanged(str(path), digest, True)
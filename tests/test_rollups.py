@@ -1,8 +1,11 @@
 import json
+import os
 import pathlib
 from datetime import datetime
 import sys
 
+import pytest
+
 sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
 
 from newsagent2 import rollups
@@ -40,6 +43,32 @@ def test_upsert_monthly_rollup_overwrites_month():
     assert entry["top_items"][0]["date"] == "2024-01-06"
 
 
+def test_upsert_monthly_rollup_replaces_invalid_month_after_sanitize():
+    state = {
+        "reports": {
+            "cybermed": [
+                {"month": m, "generated_at": "2025-01-01T00:00:00Z", "executive_summary": ["x"], "top_items": []}
+                for m in ("2025-01", "zz", "", "junk")
+            ]
+        }
+    }
+    rollups._sanitize_rollups_state(state)
+
+    for month in ("aa", "zz", "zz", "2025-02"):
+        rollups.upsert_monthly_rollup(
+            state,
+            report_key="cybermed",
+            month=month,
+            generated_at="2025-03-01T00:00:00Z",
+            executive_summary=["new"],
+            top_items=[],
+        )
+
+    months = [e["month"] for e in state["reports"]["cybermed"]]
+    assert sorted(months) == sorted(["2025-01", "2025-02", "junk", "zz", "", "aa"])
+    assert months[:2] == ["2025-01", "2025-02"]
+
+
 def test_sanitize_item_preserves_bottom_line_and_truncates():
     long_bl = " Key point\nNext\tLine " + "x" * 700
     sanitized = rollups._sanitize_item(
@@ -346,3 +375,137 @@ def test_load_rollups_state_dedupes_latest_month(tmp_path):
     assert len(entries) == 1
     assert entries[0]["generated_at"] == "2026-01-01T00:00:00Z"
     assert entries[0]["executive_summary"] == ["New"]
+
+
+def test_load_rollups_state_can_defer_self_heal_write(tmp_path):
+    path = tmp_path / "rollups.json"
+    raw_text = json.dumps(
+        {
+            "reports": {
+                "cybermed": [
+                    {"month": "2025-12", "generated_at": "2025-12-31T00:00:00Z", "executive_summary": ["Old"], "top_items": []},
+                    {"month": "2025-12", "generated_at": "2026-01-01T00:00:00Z", "executive_summary": ["New"], "top_items": []},
+                ]
+            }
+        }
+    )
+    path.write_text(raw_text, encoding="utf-8")
+
+    state = rollups.load_rollups_state(str(path), create_if_missing=False, persist_repairs=False)
+    assert [e["executive_summary"] for e in state["reports"]["cybermed"]] == [["New"]]
+    assert path.read_text(encoding="utf-8") == raw_text
+
+    missing_path = tmp_path / "missing.json"
+    rollups.load_rollups_state(str(missing_path), create_if_missing=False, persist_repairs=False)
+    assert not missing_path.exists()
+
+
+def test_save_rollups_state_round_trips_through_load(tmp_path, monkeypatch):
+    monkeypatch.setattr(rollups, "_utc_now_iso", lambda: "2026-01-01T00:00:00+00:00")
+    path = tmp_path / "rollups.json"
+    state = {
+        "version": 1,
+        "reports": {
+            "cybermed": [
+                {"month": "2025-12", "generated_at": "", "executive_summary": ["Übersicht — ok"], "top_items": [], "score": 1e-05},
+            ]
+        },
+    }
+    rollups.save_rollups_state(str(path), state)
+
+    raw = path.read_bytes()
+    assert raw == json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8") + b"\n"
+    assert rollups.load_rollups_state(str(path)) == state
+
+
+def test_save_rollups_state_skips_unchanged_state(tmp_path, monkeypatch):
+    path = tmp_path / "rollups.json"
+    state = {"version": 1, "reports": {"cybermed": [{"month": "2025-12", "executive_summary": ["A"], "top_items": []}]}}
+    monkeypatch.setattr(rollups, "_utc_now_iso", lambda: "2026-01-01T00:00:00+00:00")
+    rollups.save_rollups_state(str(path), state)
+    rollups._LOAD_CACHE.clear()
+
+    monkeypatch.setattr(rollups, "_utc_now_iso", lambda: "2026-02-01T00:00:00+00:00")
+    loaded = rollups.load_rollups_state(str(path))
+    rollups.save_rollups_state(str(path), loaded)
+    assert json.loads(path.read_text(encoding="utf-8"))["updated_at_utc"] == "2026-01-01T00:00:00+00:00"
+
+    loaded["reports"]["cybermed"][0]["executive_summary"] = ["B"]
+    rollups.save_rollups_state(str(path), loaded)
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["updated_at_utc"] == "2026-02-01T00:00:00+00:00"
+    assert saved["reports"]["cybermed"][0]["executive_summary"] == ["B"]
+
+
+def test_load_rollups_state_accepts_stdlib_only_json(tmp_path):
+    path = tmp_path / "rollups.json"
+    path.write_bytes(b'\xef\xbb\xbf{"version": 1, "reports": {}, "score": NaN}')
+
+    state = rollups.load_rollups_state(str(path))
+    assert state["reports"] == {}
+    assert state["version"] == 1
+
+
+def test_upsert_and_save_reuse_caller_timestamp(tmp_path, monkeypatch):
+    def _no_clock():
+        raise AssertionError("clock should not be read when now_iso is given")
+
+    path = tmp_path / "rollups.json"
+    state = {"version": 1, "reports": {}}
+    monkeypatch.setattr(rollups, "_utc_now_iso", _no_clock)
+    rollups.upsert_monthly_rollup(
+        state,
+        report_key="cyberlurch",
+        month="2025-03",
+        generated_at="2025-03-31T12:00:00+00:00",
+        executive_summary=["Point"],
+        top_items=[],
+        now_iso="2025-03-31T12:00:00+00:00",
+    )
+    rollups.save_rollups_state(str(path), state, now_iso="2025-03-31T12:00:00+00:00")
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["updated_at_utc"] == "2025-03-31T12:00:00+00:00"
+
+
+def test_save_rollups_state_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "rollups.json"
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rollups.os, "replace", _fail_replace)
+    with pytest.raises(OSError):
+        rollups.save_rollups_state(str(path), {"version": 1, "reports": {}})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_rollups_state_reuses_clean_parse_for_unchanged_file(tmp_path, monkeypatch):
+    path = tmp_path / "rollups.json"
+    rollups.save_rollups_state(str(path), {"version": 1, "reports": {"cyberlurch": []}})
+
+    calls = []
+    real_sanitize = rollups._sanitize_rollups_state
+
+    def _counting_sanitize(state):
+        calls.append(state)
+        return real_sanitize(state)
+
+    monkeypatch.setattr(rollups, "_sanitize_rollups_state", _counting_sanitize)
+    # The first clean load keeps only the file bytes; the state copy is taken on the second.
+    first = rollups.load_rollups_state(str(path))
+    assert rollups._LOAD_CACHE[os.path.abspath(path)][1] is None
+    first["reports"]["cyberlurch"].append({"month": "2025-01"})
+    second = rollups.load_rollups_state(str(path))
+    second["reports"]["cyberlurch"].append({"month": "2025-02"})
+    assert len(calls) == 2
+
+    third = rollups.load_rollups_state(str(path))
+    assert third["reports"]["cyberlurch"] == []
+    assert len(calls) == 2
+
+    path.write_text(path.read_text(encoding="utf-8").replace('"version": 1', '"version": 2'), encoding="utf-8")
+    fourth = rollups.load_rollups_state(str(path))
+    assert fourth["version"] == 2
+    assert len(calls) == 3
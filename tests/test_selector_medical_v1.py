@@ -1,3 +1,5 @@
+import pytest
+
 from newsagent2.selector_medical import select_cybermed_pubmed_items, select_cybermed_foamed_items, _attach_evidence_hint_labels
 
 
@@ -238,6 +240,17 @@ def test_foamed_dedupe_prefers_specific_high_confidence():
     assert res.stats["foamed_duplicates_suppressed_total"] >= 1
 
 
+def test_foamed_overview_top_k_matches_full_sort_order():
+    items = [
+        {"title": f"Sepsis post {i}", "text": f"case {i} " + "clinical review ICU sepsis airway " * (i % 7 + 1), "foamed_source": "A", "priority_tier": "1 core", "final_content_source": "article_full_text", "article_text_length": 1000, "url": f"https://x.com/post/{i}", "clinical_usefulness_1_5": i % 4 + 2, "practice_relevance_1_5": i % 3 + 2}
+        for i in range(60)
+    ]
+    full = select_cybermed_foamed_items([dict(it) for it in items], max_overview=60)
+    assert len(full.overview_items) >= 30
+    top = select_cybermed_foamed_items([dict(it) for it in items], max_overview=3)
+    assert [it["url"] for it in top.overview_items] == [it["url"] for it in full.overview_items[:3]]
+
+
 def test_foamed_source_quality_normalization_and_top_pick_floor():
     items = [
         {"title":"Core post", "text":"clinical review ICU airway " * 40, "foamed_source":"A", "priority_tier":"1 core", "final_content_source":"article_full_text", "article_text_length":1000},
@@ -266,3 +279,141 @@ def test_foamed_journalfeed_category_duplicate_overlap_and_diag_preview_sanitize
     for row in res.stats["foamed_final_selected_preview"]:
         for bad in ["title", "url", "raw_html", "full_text", "article_body", "SMTP_PASS", "OPENAI_API_KEY", "RECIPIENTS_CONFIG_JSON", "@"]:
             assert bad not in row
+
+
+def test_compiled_patterns_match_like_individual_searches():
+    from newsagent2.selector_medical import _compile_patterns, _matches_any_regex
+
+    union = _compile_patterns([r"\bmice\b", "(", r"cell line"])
+    assert len(union) == 1
+    assert _matches_any_regex("Murine model in MICE", union)
+    assert _matches_any_regex("a cell line study", union)
+    assert not _matches_any_regex("mouse", union)
+
+    # Backreferences and global inline flags only work on their own pattern.
+    separate = _compile_patterns([r"(ab)\1", r"(?x) icu \s unit", r"\bicu\b"])
+    assert len(separate) == 3
+    assert _matches_any_regex("abab", separate)
+    assert _matches_any_regex("ICU UNIT", separate)
+    assert not _matches_any_regex("ab icu-unit", separate[:2])
+
+
+def test_keyword_scanner_is_reused_while_keyword_sets_are_unchanged():
+    from newsagent2.selector_medical import _keyword_scanner, _keyword_set
+
+    design = ["randomized", "cohort"]
+    first = _keyword_scanner([_keyword_set(design), _keyword_set(None), _keyword_set([" "])])
+    assert _keyword_scanner([_keyword_set(design), _keyword_set(None), _keyword_set([" "])]) is first
+
+    design.append("registry")
+    updated_set = _keyword_set(design)
+    updated = _keyword_scanner([updated_set, _keyword_set(None)])
+    assert updated is not first
+    assert updated.scan("a national registry").hit(updated_set)
+
+
+def test_pattern_searchers_are_shared_for_equal_pattern_lists():
+    from newsagent2.selector_medical import _pattern_searchers, _search_any
+
+    first = _pattern_searchers([r"\bmice\b", "("])
+    assert _pattern_searchers([r"\bmice\b", "("]) is first
+    assert _search_any("In MICE", first)
+    assert not _search_any("mouse", first)
+    assert _pattern_searchers([]) == ()
+
+
+def test_keyword_set_automaton_matches_substring_scan(monkeypatch):
+    from newsagent2 import selector_medical
+
+    pytest.importorskip("ahocorasick")
+    keywords = [f"term{i}" for i in range(20)] + ["Septic Shock", " ", None]
+    fast = selector_medical._keyword_set(keywords)
+    assert fast.automaton is not None
+    monkeypatch.setattr(selector_medical, "ahocorasick", None)
+    slow = selector_medical._keyword_set(keywords)
+    assert slow.automaton is None
+    for text in ["no hit here", "refractory SEPTIC shock", "term19 only", "the value was none", ""]:
+        assert fast.hit(text) == slow.hit(text)
+
+
+def test_selection_config_is_reparsed_only_when_file_changes(tmp_path):
+    import os
+
+    from newsagent2.selector_medical import load_cybermed_selection_config
+
+    p = tmp_path / "sel.json"
+    p.write_text('{"enabled": true, "selection": {"max_deep_dives": 3}}')
+    first = load_cybermed_selection_config(str(p))
+    assert load_cybermed_selection_config(str(p)) is first
+
+    p.write_text('{"enabled": true, "selection": {"max_deep_dives": 40}}')
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_cybermed_selection_config(str(p))["selection"]["max_deep_dives"] == 40
+
+    p.unlink()
+    assert load_cybermed_selection_config(str(p)) == {"enabled": False}
+
+
+def test_curated_foamed_sources_are_cached_until_file_changes(tmp_path):
+    import os
+
+    from newsagent2.selector_medical import _load_curated_foamed_sources
+
+    p = tmp_path / "sources.json"
+    p.write_text('[{"name": " EMCrit "}, {"name": ""}, "x"]')
+    first = _load_curated_foamed_sources(str(p))
+    assert first == {"emcrit"}
+    first.add("mutated")
+    assert _load_curated_foamed_sources(str(p)) == {"emcrit"}
+
+    p.write_text('[{"name": "Core EM"}]')
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _load_curated_foamed_sources(str(p)) == {"core em"}
+
+    p.unlink()
+    assert _load_curated_foamed_sources(str(p)) == set()
+
+
+def test_keyword_set_is_reused_for_the_same_config_list():
+    from newsagent2.selector_medical import _keyword_set
+
+    keywords = ["Sepsis", "ICU"]
+    first = _keyword_set(keywords)
+    assert _keyword_set(keywords) is first
+
+    keywords.append("ECMO")
+    updated = _keyword_set(keywords)
+    assert updated is not first
+    assert updated.hit("ecmo run")
+
+
+def test_keyword_scanner_agrees_with_per_set_checks():
+    from newsagent2.selector_medical import _KeywordScanner, _keyword_set
+
+    pytest.importorskip("ahocorasick")
+    sets = [
+        _keyword_set(["sepsis", "septic shock"]),
+        _keyword_set([f"design{i}" for i in range(15)] + ["randomized"]),
+        _keyword_set(["shock"]),
+        _keyword_set([]),
+    ]
+    scanner = _KeywordScanner(sets)
+    assert scanner.automaton is not None
+    unscanned = _keyword_set(["icu"])
+    for text in ["", "refractory septic shock in icu", "randomized design3", "no signal"]:
+        hits = scanner.scan(text)
+        for kw in sets + [unscanned]:
+            assert hits.hit(kw) == kw.hit(text)
+
+
+def test_keyword_set_prefix_patterns_match_substring_scan(monkeypatch):
+    from newsagent2 import selector_medical
+
+    monkeypatch.setattr(selector_medical, "ahocorasick", None)
+    keywords = [f"sepsis{i}" for i in range(10)] + ["septic shock", "s", "c.diff (toxin)", "[icu]", "shock", "Steroid"]
+    kw = selector_medical._keyword_set(keywords)
+    assert kw.prefix_patterns
+    for text in ["", "x", "refractory septic shock", "c.diff (toxin) assay", "c.diff toxin", "[icu] stay", "steroid", "no hit here"]:
+        assert kw.hit(text) == any(k.lower() in text for k in keywords)
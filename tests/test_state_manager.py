@@ -0,0 +1,174 @@
+import json
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+
+from newsagent2 import state_manager
+
+
+def test_load_state_treats_whitespace_file_as_fresh(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_bytes(b" \n\t\n")
+    state = state_manager.load_state(str(path))
+    assert state["reports"] == {}
+    assert path.exists()
+
+
+def test_load_state_reads_utf8_and_renames_corrupt_file(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"reports": {"cybermed": {}}, "note": "Zürich"}, ensure_ascii=False) + "\n", encoding="utf-8")
+    state = state_manager.load_state(str(path))
+    assert state["note"] == "Zürich"
+    assert state["version"] == 1
+
+    path.write_bytes(b"{not json")
+    assert state_manager.load_state(str(path))["reports"] == {}
+    assert not path.exists()
+    assert list(tmp_path.glob("state.json.corrupt.*"))
+
+
+def test_save_state_round_trips_through_load_state(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_manager, "_utc_now_iso", lambda: "2026-01-01T00:00:00+00:00")
+    path = tmp_path / "state.json"
+    state = state_manager._new_state()
+    state_manager.mark_sent(state, "cybermed", "pubmed", "1", sent_overview=True, meta={"score": 1e-05})
+    state_manager.save_state(str(path), state)
+
+    raw = path.read_bytes()
+    assert raw == json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8") + b"\n"
+    assert state_manager.load_state(str(path)) == state
+
+
+def test_compact_state_save_round_trips_and_pretty_prints_back(tmp_path, monkeypatch):
+    from newsagent2.maintenance import state_pretty
+
+    monkeypatch.setattr(state_manager, "_utc_now_iso", lambda: "2026-01-01T00:00:00+00:00")
+    state = {
+        "version": 1,
+        "reports": {"cybermed": {"pubmed": {"processed": {"2": {"title": "Übersicht"}, "1": {"title": "b"}}}}},
+    }
+    pretty_path = tmp_path / "pretty.json"
+    state_manager.save_state(str(pretty_path), state)
+
+    monkeypatch.setenv("NEWSAGENT_STATE_COMPACT", "1")
+    compact_path = tmp_path / "compact.json"
+    state_manager.save_state(str(compact_path), state)
+
+    raw = compact_path.read_bytes()
+    assert raw.count(b"\n") == 1 and len(raw) < len(pretty_path.read_bytes())
+    assert state_manager.load_state(str(compact_path)) == state
+    assert state_pretty.pretty_state_bytes(str(compact_path)) == pretty_path.read_bytes()
+
+    assert state_pretty.main([str(compact_path), "--in-place"]) == 0
+    assert compact_path.read_bytes() == pretty_path.read_bytes()
+
+
+def test_state_pretty_in_place_leaves_no_temp_file_on_failure(tmp_path, monkeypatch):
+    from newsagent2.maintenance import state_pretty
+
+    path = tmp_path / "state.json"
+    path.write_bytes(b'{"version":1,"reports":{}}\n')
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state_pretty.os, "replace", _fail_replace)
+    with pytest.raises(OSError):
+        state_pretty.main([str(path), "--in-place"])
+    assert path.read_bytes() == b'{"version":1,"reports":{}}\n'
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_save_state_skips_unchanged_state(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    monkeypatch.setattr(state_manager, "_utc_now_iso", lambda: "2026-01-01T00:00:00+00:00")
+    state_manager.save_state(str(path), state_manager._new_state())
+
+    monkeypatch.setattr(state_manager, "_utc_now_iso", lambda: "2026-02-01T00:00:00+00:00")
+    loaded = state_manager.load_state(str(path))
+    state_manager.save_state(str(path), loaded)
+    assert json.loads(path.read_text(encoding="utf-8"))["updated_at_utc"] == "2026-01-01T00:00:00+00:00"
+
+    state_manager.mark_screened(loaded, "cybermed", "pubmed", "123")
+    state_manager.save_state(str(path), loaded)
+    assert json.loads(path.read_text(encoding="utf-8"))["updated_at_utc"] == "2026-02-01T00:00:00+00:00"
+
+
+def test_save_state_rewrites_unchanged_state_when_compact_mode_changes(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    state = state_manager._new_state()
+    state_manager.mark_screened(state, "cybermed", "pubmed", "123")
+
+    monkeypatch.setenv("NEWSAGENT_STATE_COMPACT", "1")
+    state_manager.save_state(str(path), state)
+    compact_bytes = path.read_bytes()
+    assert compact_bytes.count(b"\n") == 1
+
+    state_manager.save_state(str(path), state_manager.load_state(str(path)))
+    assert path.read_bytes() == compact_bytes
+
+    monkeypatch.setenv("NEWSAGENT_STATE_COMPACT", "0")
+    loaded = state_manager.load_state(str(path))
+    state_manager.save_state(str(path), loaded)
+    pretty_bytes = path.read_bytes()
+    assert pretty_bytes.startswith(b'{\n  "')
+    assert json.loads(pretty_bytes)["reports"] == json.loads(compact_bytes)["reports"]
+
+    state_manager.save_state(str(path), state_manager.load_state(str(path)))
+    assert path.read_bytes() == pretty_bytes
+
+
+def test_should_skip_pubmed_item_uses_sent_and_screened_timestamps():
+    state = state_manager._new_state()
+    state_manager.mark_sent(state, "cybermed", "pubmed", "1", sent_overview=True)
+    state_manager.mark_sent(state, "cybermed", "pubmed", "2", sent_overview=True, when_utc="2020-01-01T00:00:00Z")
+    state_manager.mark_screened(state, "cybermed", "pubmed", "3")
+    state_manager.mark_screened(state, "cybermed", "pubmed", "4", meta={"screened_at_utc": "not a date"})
+
+    assert state_manager.should_skip_pubmed_item(state, "cybermed", "1") == (True, "sent_overview_recent")
+    assert state_manager.should_skip_pubmed_item(state, "cybermed", "2") == (False, "sent_overview_stale")
+    assert state_manager.should_skip_pubmed_item(state, "cybermed", "3") == (False, "screened_only_recent")
+    assert state_manager.should_skip_pubmed_item(state, "cybermed", "4") == (False, "no_meta")
+    assert state_manager.should_skip_pubmed_item(state, "cybermed", "5") == (False, "new")
+
+
+def test_prune_state_drops_only_parseable_expired_entries():
+    state = state_manager._new_state()
+    state_manager.mark_processed(state, "cybermed", "pubmed", "old", processed_at_utc="2000-01-01T00:00:00Z")
+    state_manager.mark_processed(state, "cybermed", "pubmed", "naive_old", processed_at_utc="2000-01-02T00:00:00")
+    state_manager.mark_processed(state, "cybermed", "pubmed", "bad", processed_at_utc="yesterday-ish")
+    state_manager.mark_processed(state, "cybermed", "pubmed", "new")
+    state_manager.mark_processed(state, "cyberlurch", "youtube", "old2", processed_at_utc="2000-01-01T00:00:00Z")
+
+    pruned = state_manager.prune_state(state, retention_days=30)
+
+    assert pruned is state
+    assert set(state["reports"]["cybermed"]["pubmed"]["processed"]) == {"bad", "new"}
+    assert state["reports"]["cyberlurch"]["youtube"]["processed"] == {}
+
+
+def test_prune_state_cap_removes_oldest_in_insertion_order_on_ties():
+    state = state_manager._new_state()
+    for iid, ts in [("a", "2026-01-02T00:00:00+00:00"), ("b", "2026-01-01T00:00:00+00:00"), ("c", "2026-01-01T00:00:00+00:00"), ("d", None)]:
+        state_manager.mark_processed(state, "cybermed", "pubmed", iid, meta={"processed_at_utc": ts})
+
+    state_manager.prune_state(state, retention_days=0, max_entries_per_bucket=2)
+
+    assert list(state["reports"]["cybermed"]["pubmed"]["processed"]) == ["a", "c"]
+
+
+def test_mark_processed_repairs_malformed_buckets():
+    state = {"reports": {"cybermed": {"pubmed": {"processed": ["not", "a", "dict"]}, "foamed": "bad"}, "cyberlurch": []}}
+
+    state_manager.mark_processed(state, "cybermed", "pubmed", "1")
+    state_manager.mark_processed(state, "cybermed", "foamed", "2")
+    state_manager.mark_processed(state, "cyberlurch", "youtube", "3")
+    state_manager.mark_processed(state, "cybermed", "pubmed", "4", meta={"k": "v"})
+
+    assert set(state["reports"]["cybermed"]["pubmed"]["processed"]) == {"1", "4"}
+    assert state["reports"]["cybermed"]["pubmed"]["processed"]["4"]["k"] == "v"
+    assert set(state["reports"]["cybermed"]["foamed"]["processed"]) == {"2"}
+    assert set(state["reports"]["cyberlurch"]["youtube"]["processed"]) == {"3"}